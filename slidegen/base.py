@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -11,6 +12,10 @@ from slidegen.api.main import api_router
 from slidegen.common import logger_init
 from slidegen.config import settings
 from slidegen.middleware.exception import register_exception_handler
+from slidegen.workflows.presentation.icon_searcher import get_icon_searcher
+from slidegen.workflows.presentation.pages import ChapterContentPage
+from slidegen.workflows.slidegen import close_llm_http_client, get_llm_http_client
+from slidegen.workflows.utils.download_helpers import close_session as close_download_session
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -24,7 +29,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # the tables un-commenting the next lines
     # async with async_engine.begin() as conn:
     #     await conn.run_sync(Base.metadata.create_all)
+    # Load the icon embedding model up front so the first request doesn't pay for it
+    await asyncio.to_thread(get_icon_searcher)
+    # Create the shared LLM HTTP client inside the server's event loop
+    get_llm_http_client()
     yield
+    await ChapterContentPage.image_generator.aclose()
+    await close_llm_http_client()
+    await close_download_session()
     # await async_engine.dispose()
 
 
@@ -54,6 +54,7 @@ class Settings(BaseSettings):
     COMPONENTS_BASE_PATH: Path = BASE_DIR.parent / "components"
     COMPONENTS_PATH: Path = COMPONENTS_BASE_PATH / "shapes" / "shapes.json"
     LOG_DIR: str = (BASE_DIR / "logs").as_posix()
+    CACHE_DIR: str = (BASE_DIR / "cache").as_posix()
 
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
@@ -165,6 +166,11 @@ class Settings(BaseSettings):
         else:
             raise ValueError(f"Invalid database type: {self.DB_TYPE}")
 
+    # [LLM]
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    LLM_TOKENS_PER_MINUTE: int | None = None
+
     # [CELERY]
     SCHEDULE_PERIOD: int = 60
 
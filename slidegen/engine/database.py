@@ -25,6 +25,8 @@ class _DatabaseSettings:
     ASYNC_DATABASE_URL: str = settings.SQLALCHEMY_ASYNC_DATABASE_URI.encoded_string()
     DB_ECHO: bool = settings.DB_ECHO
     DB_CONNECT_ARGS: dict[str, Any] = {}
+    # Recycle pooled connections before the server drops idle ones (e.g. MySQL wait_timeout)
+    DB_POOL_RECYCLE: int = 1800
 
 
 database_settings = _DatabaseSettings()
@@ -37,6 +39,7 @@ def _make_sync_engine() -> Engine:
         database_settings.SYNC_DATABASE_URL,
         echo=database_settings.DB_ECHO,
         pool_pre_ping=True,
+        pool_recycle=database_settings.DB_POOL_RECYCLE,
         connect_args=database_settings.DB_CONNECT_ARGS,
         future=True,
         pool_size=10,
@@ -52,6 +55,7 @@ def _make_async_engine() -> AsyncEngine:
         database_settings.ASYNC_DATABASE_URL,
         echo=database_settings.DB_ECHO,
         pool_pre_ping=True,
+        pool_recycle=database_settings.DB_POOL_RECYCLE,
         connect_args=database_settings.DB_CONNECT_ARGS,
         future=True,
         pool_size=10,
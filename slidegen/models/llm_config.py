@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any
 
 from pydantic import field_validator
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 from slidegen.models.base import Base
@@ -80,9 +80,15 @@ class LLMConfigsPublic(SQLModel):
 class LLMConfigModel(Base, LLMConfigBase, table=True):
     __tablename__ = "llm_configs"
     __comment__ = "LLM configuration table"
+    # Covers the per-request default configuration lookup in the slide generation workflow, and lookups by
+    # user_id alone through its leading column, so user_id has no index of its own. Existing databases get it
+    # from a migration; create the new index before dropping the old one, MySQL needs one on the foreign key:
+    #   CREATE INDEX ix_llm_configs_user_default_active ON llm_configs (user_id, is_default, is_active);
+    #   DROP INDEX ix_llm_configs_user_id;  -- MySQL: DROP INDEX ix_llm_configs_user_id ON llm_configs;
+    __table_args__ = (Index("ix_llm_configs_user_default_active", "user_id", "is_default", "is_active"),)
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, description="Configuration ID")
-    user_id: uuid.UUID = Field(foreign_key="users.id", index=True, description="User ID")
+    user_id: uuid.UUID = Field(foreign_key="users.id", description="User ID")
     # Override extra_params to use JSON column for database
     extra_params: dict[str, Any] | None = Field(sa_column=Column(JSON), default=None, description="Extra parameters")
 
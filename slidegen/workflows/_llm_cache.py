@@ -0,0 +1,64 @@
+import asyncio
+import json
+from hashlib import sha256
+from typing import Any
+
+from agno.agent import Agent
+from agno.run.base import RunStatus
+from loguru import logger
+
+from slidegen.engine.redis import r_cache
+from slidegen.workflows._throttle import estimate_tokens, llm_limiter
+
+LLM_CACHE_PREFIX = "slidegen:llm"
+# Cached responses expire after a day so model and prompt changes are eventually picked up
+LLM_CACHE_TTL = 60 * 60 * 24
+# Seconds a cache lookup or store may take before it is given up, so a slow Redis doesn't stall the LLM calls
+LLM_CACHE_TIMEOUT = 0.5
+
+
+def _cache_key(agent: Agent, prompt: str, tag: str) -> str:
+    """Build the cache key from everything that shapes the agent's answer."""
+    payload = json.dumps(
+        [
+            agent.name,
+            agent.model.id if agent.model else None,
+            agent.description,
+            agent.instructions,
+            agent.expected_output,
+            bool(agent.tools),
+            prompt,
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{LLM_CACHE_PREFIX}:{tag}:{sha256(payload.encode()).hexdigest()}"
+
+
+async def cached_arun(agent: Agent, prompt: str, *, tag: str, ttl: int = LLM_CACHE_TTL) -> Any:
+    """
+    Run the agent on the prompt through the LLM limiter, reusing a cached response for an identical request.
+
+    The cache is best effort: Redis errors and timeouts are logged and the agent is called as if it were a miss.
+    Only non-empty responses of completed runs are stored.
+    """
+    key = _cache_key(agent, prompt, tag)
+    try:
+        cached = await asyncio.wait_for(r_cache.get(key), LLM_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed: {e!r}")
+        cached = None
+    if isinstance(cached, bytes):
+        logger.debug(f"LLM cache hit for {tag}")
+        return cached.decode()
+
+    response = await llm_limiter.run(lambda: agent.arun(prompt), est_tokens=estimate_tokens(prompt))
+    content = response.content if hasattr(response, "content") else str(response)
+
+    completed = getattr(response, "status", RunStatus.completed) == RunStatus.completed
+    if completed and isinstance(content, str) and content:
+        try:
+            await asyncio.wait_for(r_cache.set(key, content, ex=ttl), LLM_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e!r}")
+    return content
@@ -0,0 +1,110 @@
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
+from agno.exceptions import ModelProviderError
+from loguru import logger
+
+from slidegen.config import settings
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt, about four characters per token."""
+    return len(text) // 4 + 1
+
+
+class AsyncLLMLimiter:
+    """
+    Throttle LLM calls before the provider does.
+
+    - At most ``max_concurrency`` calls run at the same time.
+    - Calls are delayed so that the requests (and estimated tokens, if ``tpm`` is set)
+      started in the last ``window`` seconds stay under the configured budget.
+    - Calls rejected with a rate limit error (429) are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rpm: int,
+        tpm: int | None = None,
+        *,
+        window: float = 60.0,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 1.0,
+    ) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+
+    async def _wait_for_budget(self, est_tokens: int) -> None:
+        # Waiters queue on the lock, so the budget is handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                cutoff = now - self.window
+                while self._requests and self._requests[0] <= cutoff:
+                    self._requests.popleft()
+                while self._tokens and self._tokens[0][0] <= cutoff:
+                    self._token_total -= self._tokens.popleft()[1]
+
+                delay = 0.0
+                if len(self._requests) >= self.rpm:
+                    delay = self._requests[0] - cutoff
+                if self.tpm is not None and self._tokens and self._token_total + est_tokens > self.tpm:
+                    delay = max(delay, self._tokens[0][0] - cutoff)
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            self._requests.append(now)
+            if self.tpm is not None:
+                self._tokens.append((now, est_tokens))
+                self._token_total += est_tokens
+
+    @asynccontextmanager
+    async def slot(self, est_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a concurrency slot once the rate budget allows another call."""
+        async with self._semaphore:
+            await self._wait_for_budget(est_tokens)
+            yield
+
+    async def run(self, call: Callable[[], Awaitable[T]], est_tokens: int = 0) -> T:
+        """Run ``call`` inside a slot, retrying it when the provider reports a rate limit."""
+        attempt = 0
+        while True:
+            try:
+                async with self.slot(est_tokens):
+                    return await call()
+            except ModelProviderError as e:
+                if e.status_code != 429 or attempt >= self.max_retries:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2**attempt) + random.uniform(0, self.jitter)
+                attempt += 1
+                logger.warning(f"LLM rate limited, retrying in {delay:.1f}s ({attempt}/{self.max_retries})")
+                await asyncio.sleep(delay)
+
+
+# Shared by every workflow in the process, so the budget applies to all concurrent requests
+llm_limiter = AsyncLLMLimiter(
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    rpm=settings.LLM_REQUESTS_PER_MINUTE,
+    tpm=settings.LLM_TOKENS_PER_MINUTE,
+)
@@ -1,4 +1,18 @@
-from .docreader import DocumentReader
+from typing import TYPE_CHECKING, Any
+
 from .markdown_document import MarkdownDocument
 
+if TYPE_CHECKING:
+    from .docreader import DocumentReader
+
 __all__ = ["DocumentReader", "MarkdownDocument"]
+
+
+def __getattr__(name: str) -> Any:
+    # DocumentReader pulls in every file parser, import it only when it is used so importing
+    # MarkdownDocument stays cheap
+    if name == "DocumentReader":
+        from .docreader import DocumentReader
+
+        return DocumentReader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
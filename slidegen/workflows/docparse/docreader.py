@@ -1,8 +1,10 @@
 import copy
+import mmap
 import os
 import re
 import tempfile
 import traceback
+import zipfile
 from pathlib import Path
 from typing import Any, BinaryIO
 
@@ -21,6 +23,32 @@ from slidegen.workflows.docparse.reader import (
     TextParser,
 )
 
+# Matches the first byte that is not ASCII whitespace (same set as ``bytes.isspace``)
+_NON_WHITESPACE_RE = re.compile(rb"\S")
+
+# Number of leading bytes inspected by the signature table
+_SIGNATURE_HEAD_SIZE = 16
+
+# Signatures of the most common uploads, compared against the lower-cased file head
+_MAGIC_SIGNATURES: tuple[tuple[bytes, tuple[str, ...]], ...] = (
+    (b"%pdf", (".pdf",)),
+    (b"\xd0\xcf\x11\xe0", (".xls", ".doc")),
+    (b"<!doctype html", (".html",)),
+    (b"<html", (".html",)),
+)
+
+_ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Filename extensions trusted without sniffing the file content
+_TRUSTED_EXTS = frozenset({".pdf", ".docx", ".xlsx", ".xls", ".txt", ".md", ".html", ".htm"})
+
+# Office Open XML packages are ZIP archives, told apart by their main part
+_OOXML_MAIN_PARTS: tuple[tuple[str, str], ...] = (
+    ("word/document.xml", ".docx"),
+    ("xl/workbook.xml", ".xlsx"),
+    ("ppt/presentation.xml", ".pptx"),
+)
+
 
 class DocumentReader:
     """Convert file to markdown"""
@@ -53,8 +81,10 @@ class DocumentReader:
         base, ext = os.path.splitext(path)
         self._append_ext(extensions, ext)
 
-        for g in self._guess_ext_magic(path):
-            self._append_ext(extensions, g)
+        # Only sniff the content when the filename extension is missing or unknown
+        if ext.lower() not in _TRUSTED_EXTS:
+            for g in self._guess_ext_magic(path):
+                self._append_ext(extensions, g)
 
         # Convert
         return self._convert(path, extensions, **kwargs)
@@ -151,17 +181,23 @@ class DocumentReader:
     def _guess_ext_magic(self, path: str) -> list[str]:
         """Use puremagic (a Python implementation of libmagic) to guess a file's extension based on the first few bytes."""
         try:
+            with open(path, "rb") as file:
+                head = file.read(_SIGNATURE_HEAD_SIZE)
+            extensions = self._guess_ext_signature(path, head)
+            if extensions:
+                return extensions
+
             guesses = puremagic.magic_file(path)
 
             if len(guesses) == 0:
                 with open(path, "rb") as file:
-                    while True:
-                        char = file.read(1)
-                        if not char:  # End of file
-                            break
-                        if not char.isspace():
-                            file.seek(file.tell() - 1)
-                            break
+                    size = os.fstat(file.fileno()).st_size
+                    if size > 0:
+                        # Skip leading whitespace with a single C-level scan over the mapped file
+                        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            match = _NON_WHITESPACE_RE.search(mm)
+                            offset = match.start() if match else size
+                        file.seek(offset)
                     try:
                         guesses = puremagic.magic_stream(file)
                     except puremagic.main.PureError:
@@ -183,3 +219,23 @@ class DocumentReader:
         except PermissionError:
             pass
         return []
+
+    @staticmethod
+    def _guess_ext_signature(path: str, head: bytes) -> list[str]:
+        """Guess a file's extension from a small table of common signatures, without calling puremagic."""
+        lowered = head.lower()
+        for signature, extensions in _MAGIC_SIGNATURES:
+            if lowered.startswith(signature):
+                return list(extensions)
+
+        if head.startswith(_ZIP_SIGNATURE):
+            # Only the central directory is read to list the archive members
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    names = set(archive.namelist())
+            except zipfile.BadZipFile:
+                return []
+            for part, ext in _OOXML_MAIN_PARTS:
+                if part in names:
+                    return [ext]
+        return []
@@ -8,6 +8,16 @@ from .elements import CodeBlock, Element, Heading, Paragraph, Picture, Table
 
 __all__ = ["Heading", "MarkdownDocument", "MarkdownParser"]
 
+# Line patterns, compiled once since every line of a document is matched against them
+_CODE_BLOCK_START_RE = re.compile(r"^\s*```(\w+)?")
+_LIST_RE = re.compile(r"^([\*\-\+])\s+(.*)")
+_OLIST_RE = re.compile(r"^(\d+)[\.\)]\s+(.*)")
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*:?-+:\s*$")
+_IMAGE_RE = re.compile(r"!\[(.*?)\]\((.*?)\s*(?:\"(.*?)\")?\)")
+_BLANK_RE = re.compile(r"^\s*$")
+_SETEXT_UNDERLINE_RE = {1: re.compile(r"^={3,}\s*$"), 2: re.compile(r"^-{3,}\s*$")}
+_ATX_HEADING_RE = re.compile(r"^(\s?(#{1,6})\s+)(.*)$")
+
 
 class MarkdownDocument(Element):
     ROOT_ELEMENT_NAME: str = "[markdowndocument]"
@@ -101,7 +111,7 @@ class MarkdownParser:
                 return
 
     def process_code_block_start(self, line: str, next_line: str | None = None) -> bool:
-        match = re.search(r"^\s*```(\w+)?", line)
+        match = _CODE_BLOCK_START_RE.search(line)
         if match:
             self.in_code_block = True
             self.code_language = match.group(1)
@@ -126,21 +136,17 @@ class MarkdownParser:
             self.jump_to_next = True
             return is_heading
 
-        for level in range(1, 7):
-            is_heading = self._parse_heading_var_two(level, line)
-            if is_heading:
-                break
-        return is_heading
+        return self._parse_heading_var_two(line)
 
     def process_list(self, line: str, next_line: str | None = None) -> bool:
         stripped_line = line.lstrip()
 
-        list_match = re.match(r"^([\*\-\+])\s+(.*)", stripped_line)
+        list_match = _LIST_RE.match(stripped_line)
         if list_match:
             self.handle_list(list_match)
             return True
 
-        olist_match = re.match(r"^(\d+)[\.\)]\s+(.*)", stripped_line)
+        olist_match = _OLIST_RE.match(stripped_line)
         if olist_match:
             self.handle_list(olist_match)
             return True
@@ -181,7 +187,7 @@ class MarkdownParser:
             return False
         parts = separator.split("|")[1:-1]
         for part in parts:
-            if not re.match(r"^\s*:?-+:\s*$", part.strip()):
+            if not _TABLE_SEPARATOR_RE.match(part.strip()):
                 return False
         return True
 
@@ -257,7 +263,7 @@ class MarkdownParser:
         self.previous_heading.append(table)
 
     def process_image(self, line: str, next_line: str | None = None) -> bool:
-        match = re.match(r"!\[(.*?)\]\((.*?)\s*(?:\"(.*?)\")?\)", line)
+        match = _IMAGE_RE.match(line)
         if match:
             alt = match.group(1)
             src = match.group(2)
@@ -276,32 +282,27 @@ class MarkdownParser:
         return True
 
     def _parse_heading_var_one(self, level: int, string: str, next_string: str | None) -> bool:
-        if next_string is None or re.search(r"^\s*$", string) is not None:
+        if next_string is None or _BLANK_RE.search(string) is not None:
             return False
 
-        if level == 1:
-            tmpl = "="
-        elif level == 2:
-            tmpl = "-"
-        else:
+        if level not in _SETEXT_UNDERLINE_RE:
             raise Exception(f"Not support level: {level}")
 
-        regex = rf"^{tmpl}{{3,}}\s*$"
-        result = re.search(regex, next_string)
+        result = _SETEXT_UNDERLINE_RE[level].search(next_string)
 
         if result is None:
             return False
 
         return self._parse_heading_action(level=level, text=string.strip(), text_source=f"{string}\n{next_string}")
 
-    def _parse_heading_var_two(self, level: int, string: str) -> bool:
-        regex = rf"^(\s?#{{{level}}}\s+)(.*)$"
-        result = re.search(regex, string)
+    def _parse_heading_var_two(self, string: str) -> bool:
+        # A single match finds the level from the number of leading "#"
+        result = _ATX_HEADING_RE.search(string)
 
         if result is None:
             return False
 
-        return self._parse_heading_action(level=level, text=result[2], text_source=result[1] + result[2])
+        return self._parse_heading_action(level=len(result[2]), text=result[3], text_source=result[1] + result[3])
 
     def _parse_heading_action(self, level: int, text: str, text_source: str) -> bool:
         cur_heading = Heading(level, text)
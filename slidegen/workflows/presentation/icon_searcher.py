@@ -1,5 +1,6 @@
 import asyncio
 import json
+from collections import OrderedDict
 from pathlib import Path
 
 import chromadb
@@ -7,6 +8,9 @@ from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 from loguru import logger
 
+# Number of (query, k) search results remembered per searcher
+ICON_SEARCH_CACHE_SIZE = 1024
+
 
 class IconSearcher:
     def __init__(self) -> None:
@@ -16,6 +20,7 @@ class IconSearcher:
         self.default_icons_path = Path("components/icons.json")
         self._initialize_icons_collection()
         logger.info("Icons collection initialized.")
+        self._search_cache: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
 
     def _initialize_icons_collection(self) -> None:
         self.embedding_function = ONNXMiniLM_L6_V2()
@@ -48,12 +53,43 @@ class IconSearcher:
                 self.collection.add(documents=documents, ids=ids)
 
     async def search_icons(self, query: str, k: int = 1) -> list[str]:
-        result = await asyncio.to_thread(
-            self.collection.query,
-            query_texts=[query],
-            n_results=k,
-        )
-        return [f"components/icons/bold/{each}.png" for each in result["ids"][0]]
+        return (await self.search_icons_batch([query], k=k))[0]
+
+    async def search_icons_batch(self, queries: list[str], k: int = 1) -> list[list[str]]:
+        """Search icons for several queries with a single collection query, preserving query order."""
+        # Slide titles repeat heavily across a deck, so recent results are memoized
+        found: dict[str, list[str]] = {}
+        missing: list[str] = []
+        for query in dict.fromkeys(queries):
+            cached = self._search_cache.get((query, k))
+            if cached is not None:
+                self._search_cache.move_to_end((query, k))
+                found[query] = cached
+            else:
+                missing.append(query)
+
+        if missing:
+            result = await asyncio.to_thread(
+                self.collection.query,
+                query_texts=missing,
+                n_results=k,
+            )
+            for query, ids in zip(missing, result["ids"], strict=True):
+                found[query] = [f"components/icons/bold/{each}.png" for each in ids]
+                self._search_cache[(query, k)] = found[query]
+            while len(self._search_cache) > ICON_SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+        results = [list(found[query]) for query in queries]
+        return results
+
+
+_icon_searcher: IconSearcher | None = None
 
 
-icon_searcher = IconSearcher()
+def get_icon_searcher() -> IconSearcher:
+    """Return the process-wide IconSearcher, loading the model and collection on first use."""
+    global _icon_searcher
+    if _icon_searcher is None:
+        _icon_searcher = IconSearcher()
+    return _icon_searcher
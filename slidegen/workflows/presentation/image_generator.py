@@ -1,7 +1,10 @@
 import asyncio
+import json
 import os
 import uuid
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from urllib.parse import quote_plus
 
 import aiohttp
@@ -10,9 +13,10 @@ from google.genai.types import GenerateContentConfig
 from loguru import logger
 from openai import AsyncOpenAI
 
+from slidegen.config import settings
 from slidegen.models.image_asset import ImageAsset
 from slidegen.schemas.image_prompt import ImagePrompt
-from slidegen.workflows.utils.download_helpers import download_file
+from slidegen.workflows.utils.download_helpers import download_file, get_session, proxy_for
 from slidegen.workflows.utils.get_env import get_pexels_api_key_env, get_pixabay_api_key_env
 from slidegen.workflows.utils.image_provider import (
     is_dalle3_selected,
@@ -21,11 +25,61 @@ from slidegen.workflows.utils.image_provider import (
     is_pixabay_selected,
 )
 
+# Resolved stock image URLs, keyed by provider and prompt, kept across runs
+STOCK_URL_CACHE_PATH = Path(settings.CACHE_DIR) / "stock_urls.json"
+STOCK_URL_CACHE_SIZE = 512
+# Stock search requests fail fast on unreachable hosts instead of waiting on the download session's read timeout
+STOCK_API_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=5)
+
 
 class ImageGenerator:
     def __init__(self, output_directory: str) -> None:
         self.output_directory = output_directory
         self.image_gen_func = self.get_image_gen_func()
+        self._genai_client: genai.Client | None = None
+        self._openai_client: AsyncOpenAI | None = None
+        self._stock_url_cache = self._load_stock_url_cache()
+
+    def _get_genai_client(self) -> genai.Client:
+        """Return the shared Gemini client, created on first use so the API key is only required when selected."""
+        if self._genai_client is None:
+            self._genai_client = genai.Client()
+        return self._genai_client
+
+    def _get_openai_client(self) -> AsyncOpenAI:
+        """Return the shared OpenAI client, created on first use so the API key is only required when selected."""
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI()
+        return self._openai_client
+
+    async def aclose(self) -> None:
+        """Close the shared API clients. Call on application shutdown."""
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+        self._save_stock_url_cache()
+
+    @staticmethod
+    def _load_stock_url_cache() -> OrderedDict[str, str]:
+        try:
+            with open(STOCK_URL_CACHE_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        if not isinstance(data, dict):
+            logger.warning(f"Ignoring malformed stock image URL cache {STOCK_URL_CACHE_PATH}")
+            return OrderedDict()
+        return OrderedDict((k, v) for k, v in data.items() if isinstance(k, str) and isinstance(v, str))
+
+    def _save_stock_url_cache(self) -> None:
+        if not self._stock_url_cache:
+            return
+        try:
+            STOCK_URL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(STOCK_URL_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._stock_url_cache, f, ensure_ascii=False)
+        except OSError:
+            logger.exception(f"Failed to save stock image URL cache to {STOCK_URL_CACHE_PATH}")
 
     def get_image_gen_func(self) -> Callable[..., Awaitable[str]] | None:
         if is_pixabay_selected():
@@ -73,9 +127,22 @@ class ImageGenerator:
             logger.info(f"Error generating image: {e!s}")
             return ImageAsset(path="/static/images/placeholder.jpg")
 
+    async def generate_images(self, prompts: list[ImagePrompt], max_concurrency: int = 8) -> list[ImageAsset]:
+        """
+        Generates images for several prompts concurrently.
+        - At most `max_concurrency` requests are in flight at the same time.
+        - Results are returned in the same order as the prompts.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate(prompt: ImagePrompt) -> ImageAsset:
+            async with semaphore:
+                return await self.generate_image(prompt)
+
+        return list(await asyncio.gather(*(_generate(prompt) for prompt in prompts)))
+
     async def generate_image_openai(self, prompt: str, output_directory: str) -> str:
-        client = AsyncOpenAI()
-        result = await client.images.generate(
+        result = await self._get_openai_client().images.generate(
             model="dall-e-3",
             prompt=prompt,
             n=1,
@@ -88,9 +155,7 @@ class ImageGenerator:
         return await download_file(image_url, output_directory)
 
     async def generate_image_google(self, prompt: str, output_directory: str) -> str:
-        client = genai.Client()
-        response = await asyncio.to_thread(
-            client.models.generate_content,
+        response = await self._get_genai_client().aio.models.generate_content(
             model="gemini-2.0-flash-preview-image-generation",
             contents=prompt,
             config=GenerateContentConfig(response_modalities=["TEXT", "IMAGE"]),
@@ -101,34 +166,69 @@ class ImageGenerator:
                 logger.info(part.text)
             elif part.inline_data is not None:
                 image_path = os.path.join(output_directory, f"{uuid.uuid4()}.jpg")
-                with open(image_path, "wb") as f:
-                    f.write(part.inline_data.data)  # type: ignore
+                # Write off the event loop so other image requests keep progressing
+                await asyncio.to_thread(Path(image_path).write_bytes, part.inline_data.data)  # type: ignore
 
         return image_path
 
-    async def get_image_from_pexels(self, prompt: str, output_directory: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://api.pexels.com/v1/search?query={quote_plus(prompt)}&per_page=1",
-                headers={"Authorization": f"{get_pexels_api_key_env()}"},
-            )
-            data = await response.json()
-            try:
-                image_url = data["photos"][0]["src"]["large"]
-            except Exception:
-                logger.exception("Pexels response parsing failed or no result")
-                raise
+    async def get_stock_image(
+        self,
+        provider: str,
+        prompt: str,
+        output_directory: str,
+        resolve_url: Callable[[str], Awaitable[str]],
+    ) -> str:
+        """
+        Downloads a stock image for the prompt.
+        - The resolved image URL is cached per (provider, prompt), so repeated prompts skip the search API.
+        - The image is downloaded through the URL cache of download_file, so a repeated URL returns the file
+        already saved in the output directory instead of downloading it again.
+        """
+        key = f"{provider}:{prompt}"
+        image_url = self._stock_url_cache.get(key)
+        if image_url is None:
+            image_url = await resolve_url(prompt)
+            self._stock_url_cache[key] = image_url
+            if len(self._stock_url_cache) > STOCK_URL_CACHE_SIZE:
+                self._stock_url_cache.popitem(last=False)
+        else:
+            self._stock_url_cache.move_to_end(key)
+
+        try:
             return await download_file(image_url, output_directory)
+        except Exception:
+            # The cached URL may have expired; resolve it again next time
+            self._stock_url_cache.pop(key, None)
+            raise
+
+    async def get_image_from_pexels(self, prompt: str, output_directory: str) -> str:
+        return await self.get_stock_image("pexels", prompt, output_directory, self._resolve_pexels_url)
 
     async def get_image_from_pixabay(self, prompt: str, output_directory: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={quote_plus(prompt)}&image_type=photo&per_page=3"
-            )
+        return await self.get_stock_image("pixabay", prompt, output_directory, self._resolve_pixabay_url)
+
+    async def _resolve_pexels_url(self, prompt: str) -> str:
+        # Stock searches go through the download session, sharing its connection pool and proxy settings
+        url = f"https://api.pexels.com/v1/search?query={quote_plus(prompt)}&per_page=1"
+        async with get_session().get(
+            url,
+            headers={"Authorization": f"{get_pexels_api_key_env()}"},
+            proxy=proxy_for(url),
+            timeout=STOCK_API_TIMEOUT,
+        ) as response:
             data = await response.json()
-            try:
-                image_url = data["hits"][0]["largeImageURL"]
-            except Exception:
-                logger.exception("Pixabay response parsing failed or no result")
-                raise
-            return await download_file(image_url, output_directory)
+        try:
+            return str(data["photos"][0]["src"]["large"])
+        except Exception:
+            logger.exception("Pexels response parsing failed or no result")
+            raise
+
+    async def _resolve_pixabay_url(self, prompt: str) -> str:
+        url = f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={quote_plus(prompt)}&image_type=photo&per_page=3"
+        async with get_session().get(url, proxy=proxy_for(url), timeout=STOCK_API_TIMEOUT) as response:
+            data = await response.json()
+        try:
+            return str(data["hits"][0]["largeImageURL"])
+        except Exception:
+            logger.exception("Pixabay response parsing failed or no result")
+            raise
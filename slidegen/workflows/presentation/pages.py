@@ -19,7 +19,7 @@ from slidegen.exception import PPTGenError, PPTTemplateError
 from slidegen.schemas.image_prompt import ImagePrompt
 from slidegen.workflows.docparse.markdown_document import Heading
 from slidegen.workflows.presentation.components import ChapterLayout, ContentType, components_manager
-from slidegen.workflows.presentation.icon_searcher import IconSearcher, icon_searcher
+from slidegen.workflows.presentation.icon_searcher import get_icon_searcher
 from slidegen.workflows.presentation.image_generator import ImageGenerator
 from slidegen.workflows.utils.get_env import get_temp_directory_env
 from slidegen.workflows.utils.slide_utils import (
@@ -519,7 +519,6 @@ class ChapterContentPage(Page):
     image_generator: ImageGenerator = ImageGenerator(
         get_temp_directory_env() or os.path.join(os.getcwd(), "generated_images")
     )
-    icon_searcher: IconSearcher = icon_searcher
 
     @staticmethod
     def _get_slide_type(content: Heading) -> int:
@@ -537,6 +536,15 @@ class ChapterContentPage(Page):
             for paragraph in tf.paragraphs:
                 paragraph.alignment = PP_ALIGN.JUSTIFY
 
+    @staticmethod
+    def _get_icon_query(content: Heading, titles: list[str], section_texts: list[str], idx: int) -> str:
+        """Get the icon search query for the idx-th icon, preferring its title over its text"""
+        if idx < len(titles) and titles[idx]:
+            return titles[idx]
+        if idx < len(section_texts) and section_texts[idx]:
+            return section_texts[idx]
+        return content.element_text
+
     @staticmethod
     async def generate_slide(
         prs: Presentation,
@@ -579,17 +587,52 @@ class ChapterContentPage(Page):
         # Sort by zorder
         sorted_shapes = sorted(style.shapes.items(), key=lambda x: x[1].zorder)
 
+        # Check the text counts before any picture or icon is requested, so a rejected slide costs no API calls
+        for _, shape in sorted_shapes:
+            locs = shape.location
+            if not locs:
+                continue
+            if shape.content_type == ContentType.CONTENT and len(section_texts) != len(locs):
+                raise PPTGenError(
+                    f"{ChapterContentPage.__name__}: \
+                                Text content must be equal to the number of locations: {len(section_texts)} != {len(locs)}"
+                )
+            if shape.content_type == ContentType.TITLE and len(titles) != len(locs):
+                raise PPTGenError(
+                    f"{ChapterContentPage.__name__}: \
+                                Title must be equal to the number of locations: {len(titles)} != {len(locs)}"
+                )
+
+        # Generate every picture of the slide concurrently, then consume them in placement order
+        picture_prompts = [
+            ImagePrompt(prompt=titles[idx] if idx < len(titles) else content.element_text, theme_prompt=None)
+            for _, shape in sorted_shapes
+            if shape.content_type == ContentType.PICTURE
+            for idx in range(len(shape.location))
+        ]
+        picture_results = iter(await ChapterContentPage.image_generator.generate_images(picture_prompts))
+
+        # Search every icon of the slide with a single query
+        icon_queries = [
+            ChapterContentPage._get_icon_query(content, titles, section_texts, idx)
+            for _, shape in sorted_shapes
+            if shape.content_type == ContentType.ICON
+            for idx in range(len(shape.location))
+        ]
+        icon_search_results: list[list[str]] = [[] for _ in icon_queries]
+        if icon_queries:
+            try:
+                icon_search_results = await get_icon_searcher().search_icons_batch(icon_queries, k=1)
+            except Exception:
+                logger.exception(f"{ChapterContentPage.__name__}: Icon search failed")
+        icon_results = iter(icon_search_results)
+
         for shape_name, shape in sorted_shapes:
             # locs must be in order
             locs = shape.location
             for idx, loc in enumerate(locs):
                 match shape.content_type:
                     case ContentType.CONTENT:
-                        if len(section_texts) != len(locs):
-                            raise PPTGenError(
-                                f"{ChapterContentPage.__name__}: \
-                                            Text content must be equal to the number of locations: {len(section_texts)} != {len(locs)}"
-                            )
                         added_shape = add_shape_by_xml(
                             slide=new_slide,
                             shape_xml=shape.xml,
@@ -600,11 +643,6 @@ class ChapterContentPage(Page):
                         )
                         ChapterContentPage._shape_alignment(added_shape)
                     case ContentType.TITLE:
-                        if len(titles) != len(locs):
-                            raise PPTGenError(
-                                f"{ChapterContentPage.__name__}: \
-                                            Title must be equal to the number of locations: {len(titles)} != {len(locs)}"
-                            )
                         added_shape = add_shape_by_xml(
                             slide=new_slide,
                             shape_xml=shape.xml,
@@ -616,15 +654,9 @@ class ChapterContentPage(Page):
                         ChapterContentPage._shape_alignment(added_shape)
                     case ContentType.PICTURE:
                         image_path = None
-                        try:
-                            prompt_text = titles[idx] if idx < len(titles) else content.element_text
-                            prompt = ImagePrompt(prompt=prompt_text, theme_prompt=None)
-
-                            image_result = await ChapterContentPage.image_generator.generate_image(prompt)
-                            if image_result.path and os.path.exists(image_result.path):
-                                image_path = image_result.path
-                        except Exception:
-                            logger.exception(f"{ChapterContentPage.__name__}: Image generation failed")
+                        image_result = next(picture_results)
+                        if image_result.path and os.path.exists(image_result.path):
+                            image_path = image_result.path
 
                         added_shape = new_slide.shapes.add_picture(image_path, loc.x, loc.y, loc.width, loc.height)
                     case ContentType.NUMBER:
@@ -638,22 +670,11 @@ class ChapterContentPage(Page):
                         )
                     case ContentType.ICON:
                         icon_path = None
-                        try:
-                            query = None
-                            if idx < len(titles) and titles[idx]:
-                                query = titles[idx]
-                            elif idx < len(section_texts) and section_texts[idx]:
-                                query = section_texts[idx]
-                            else:
-                                query = content.element_text
-
-                            results = await ChapterContentPage.icon_searcher.search_icons(query, k=1)
-                            if results:
-                                rel_path = results[0]
-                                abs_path = os.path.join(Path(__file__).resolve().parents[3], rel_path)
-                                icon_path = abs_path if os.path.exists(abs_path) else rel_path
-                        except Exception:
-                            logger.exception(f"{ChapterContentPage.__name__}: Icon search failed")
+                        results = next(icon_results)
+                        if results:
+                            rel_path = results[0]
+                            abs_path = os.path.join(Path(__file__).resolve().parents[3], rel_path)
+                            icon_path = abs_path if os.path.exists(abs_path) else rel_path
 
                         if not icon_path:
                             placeholder_rel = os.path.join("components", "icons", "placeholder.png")
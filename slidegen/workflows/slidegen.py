@@ -1,56 +1,215 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from itertools import islice
 from typing import cast
 
+import httpx
 from agno.agent import Agent
+from agno.models.azure.openai_chat import AzureOpenAI
 from agno.models.base import Model
 from agno.models.openai import OpenAIChat
-from agno.tools.duckduckgo import DuckDuckGoTools
-from agno.workflow import Loop, Step, Workflow
+from agno.workflow import Step, Workflow
 from agno.workflow.types import StepInput, StepOutput
 from loguru import logger
-from sqlmodel import select
+from sqlalchemy import bindparam
+from sqlmodel import case, or_, select
 
 from slidegen.controller.llm_factory import LLMFactory
 from slidegen.engine.database import AsyncSessionLocal
 from slidegen.models.llm_config import LLMConfigModel
 from slidegen.schemas.gen_request import GeneratePresentationRequest, LLMConfigRequest
-from slidegen.workflows.docparse.markdown_parser import MarkdownDocument
+from slidegen.workflows._llm_cache import cached_arun
+from slidegen.workflows.docparse.markdown_document import MarkdownDocument
+from slidegen.workflows.docparse.markdown_document.elements import Element
 
 # Maximum number of sections to generate
-MAX_ITERATIONS = 35
+MAX_SECTIONS = 35
+# Maximum number of sections written concurrently
+SECTION_CONCURRENCY = 5
+# Number of parsed outlines kept, outlines repeat when their LLM response is served from the cache
+OUTLINE_PARSE_CACHE_SIZE = 128
+
+
+# Resolved LLM models are reused across requests by (user_id, llm_config_id), so the provider
+# clients and their connection pools are not rebuilt for every presentation
+MODEL_CACHE_SIZE = 64
+MODEL_CACHE_TTL = 60
+_model_cache: OrderedDict[tuple[uuid.UUID, uuid.UUID | None], tuple[float, Model]] = OrderedDict()
+
+# agno's OpenAI compatible models build a new httpx client, so a new connection and TLS handshake,
+# for every async call unless one is given; workflow models share this one instead
+_llm_http_client: httpx.AsyncClient | None = None
+
+# Instructions and expected outputs shared by every workflow, built once at import
+TONE_INSTRUCTIONS = {
+    "default": "Use a neutral, professional tone",
+    "casual": "Use a friendly, conversational tone",
+    "professional": "Use a formal, professional tone",
+    "funny": "Use a humorous, engaging tone",
+    "educational": "Use a clear, educational tone suitable for learning",
+    "sales_pitch": "Use a persuasive, sales-oriented tone",
+}
+
+VERBOSITY_INSTRUCTIONS = {
+    "concise": "Keep content brief and to the point",
+    "standard": "Provide balanced content with sufficient detail",
+    "text-heavy": "Provide comprehensive, detailed content",
+}
+
+OUTLINE_EXPECTED_OUTPUT = (
+    "Output the content outline for this PowerPoint section in Markdown, using headings up to level 3 only. Do not use level-4 or deeper headings.\n"
+    "Must follow:\n"
+    "- Top-level (#): Use the current section title and include it exactly once\n"
+    "- Second-level (##): Split this section into 1-4 clear subsections\n"
+    "- Third-level (###): For each subsection, provide 1-4 key points based on the content's depth and relevance\n"
+    "- Output Markdown only; do not add explanations, prefixes, or unrelated text\n"
+    "Example structure (illustrative; do not copy the content):\n"
+    "# PowerPoint Title\n"
+    "## Subsection A\n"
+    "### Key point 1\n"
+    "### Key point 2\n"
+    "## Subsection B\n"
+    "### Key point 1\n"
+    "### Key point 2\n"
+    "### Key point 3\n"
+)
+
+CONTENT_EXPECTED_OUTPUT = (
+    "You must strictly maintain the original outline structure provided in the input:\n"
+    "- Keep all heading levels (##, ###) exactly as given\n"
+    "- Do NOT change, add, or remove any headings\n"
+    "- Do NOT add numbered lists or bullet points under level-3 headings (###)\n"
+    "- Write content directly as paragraph text under each heading\n"
+    "- Output Markdown only; do not add explanations, prefixes, or unrelated text\n"
+    "\n"
+    "Example:\n"
+    "Input:\n"
+    "## Section A\n"
+    "### Key point 1\n"
+    "### Key point 2\n"
+    "\n"
+    "Output:\n"
+    "## Section A\n"
+    "### Key point 1\n"
+    "Write detailed paragraph content here without using numbered lists or bullet points.\n"
+    "### Key point 2\n"
+    "Write detailed paragraph content here without using numbered lists or bullet points.\n"
+)
+
+# Prompt prefix shared by every section of a presentation, only the outline is filled in per run
+SECTION_CONTEXT_TEMPLATE = (
+    "The following is the outline of the whole presentation:\n\n{outline}\n\n"
+    "Write detailed content for the following powerpoint section:\n\n"
+)
+
+# LLM configuration lookups, built once and bound with the user and configuration ids per request
+_DEFAULT_LLM_CONFIG_STMT = (
+    select(LLMConfigModel)
+    .where(
+        LLMConfigModel.user_id == bindparam("user_id"),
+        LLMConfigModel.is_active == True,  # noqa: E712
+        LLMConfigModel.is_default == True,  # noqa: E712
+    )
+    .limit(1)
+)
+_LLM_CONFIG_STMT = (
+    select(LLMConfigModel)
+    .where(
+        LLMConfigModel.user_id == bindparam("user_id"),
+        LLMConfigModel.is_active == True,  # noqa: E712
+        or_(
+            LLMConfigModel.id == bindparam("config_id"),
+            LLMConfigModel.is_default == True,  # noqa: E712
+        ),
+    )
+    .order_by(case((LLMConfigModel.id == bindparam("config_id"), 0), else_=1))
+    .limit(1)
+)
+
+
+@lru_cache(maxsize=OUTLINE_PARSE_CACHE_SIZE)
+def _parse_markdown_cached(source: str) -> MarkdownDocument:
+    """Parse an outline once per distinct text, the workflow only reads the shared document"""
+    return MarkdownDocument(source)
+
+
+async def _resolve_llm_instance(request: GeneratePresentationRequest | LLMConfigRequest) -> Model:
+    """Create the LLM instance from the request or the user's configuration, raising if none is found"""
+    if isinstance(request, LLMConfigRequest):
+        return LLMFactory.create_llm(request)
+
+    async with AsyncSessionLocal() as session:
+        # Use specified configuration ID first, otherwise user's default configuration,
+        # resolved with a single prebuilt query
+        if request.llm_config_id:
+            config = await session.scalar(
+                _LLM_CONFIG_STMT, {"user_id": request.user_id, "config_id": request.llm_config_id}
+            )
+        else:
+            config = await session.scalar(_DEFAULT_LLM_CONFIG_STMT, {"user_id": request.user_id})
+    if config is None:
+        raise ValueError("No active LLM configuration found")
+    return LLMFactory.create_llm(config)
 
 
 async def get_llm_instance(request: GeneratePresentationRequest | LLMConfigRequest) -> Model:
     """Get LLM instance based on request parameters"""
     try:
-        # If user ID is specified, try to get user's LLM configuration
-        if isinstance(request, GeneratePresentationRequest):
-            async with AsyncSessionLocal() as session:
-                # Use specified configuration ID first
-                if request.llm_config_id:
-                    config = await session.get(LLMConfigModel, request.llm_config_id)
-                    if config and config.user_id == request.user_id and config.is_active:
-                        return LLMFactory.create_llm(config)
-
-                # Otherwise use user's default configuration
-                statement = select(LLMConfigModel).where(
-                    LLMConfigModel.user_id == request.user_id,
-                    LLMConfigModel.is_default == True,  # noqa: E712
-                    LLMConfigModel.is_active == True,  # noqa: E712
-                )
-                config = (await session.execute(statement)).scalars().first()
-                if config:
-                    return LLMFactory.create_llm(config)
-                else:
-                    raise ValueError("No active LLM configuration found")
-
-        elif isinstance(request, LLMConfigRequest):
-            return LLMFactory.create_llm(request)
-
+        return await _resolve_llm_instance(request)
     except Exception as e:
         logger.warning(f"Failed to get LLM instance, using default configuration: {e!s}")
         return OpenAIChat(id="gpt-4o-mini")
 
 
+def get_llm_http_client() -> httpx.AsyncClient:
+    """Return the shared LLM HTTP client, creating it on first use inside the running event loop."""
+    global _llm_http_client
+    if _llm_http_client is None or _llm_http_client.is_closed:
+        _llm_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(600, connect=5),
+        )
+    return _llm_http_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared LLM HTTP client. Call on application shutdown."""
+    global _llm_http_client
+    if _llm_http_client is not None and not _llm_http_client.is_closed:
+        await _llm_http_client.aclose()
+    _llm_http_client = None
+    _model_cache.clear()
+
+
+async def get_cached_llm_instance(request: GeneratePresentationRequest) -> Model:
+    """Get the LLM instance for the request, reusing a recently resolved one for the same configuration"""
+    key = (request.user_id, request.llm_config_id)
+    cached = _model_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < MODEL_CACHE_TTL:
+        _model_cache.move_to_end(key)
+        return cached[1]
+
+    try:
+        llm = await _resolve_llm_instance(request)
+    except Exception as e:
+        # The fallback is not cached, so the user's configuration is looked up again on the next request
+        logger.warning(f"Failed to get LLM instance, using default configuration: {e!s}")
+        return OpenAIChat(id="gpt-4o-mini", http_client=get_llm_http_client())
+
+    # Azure keeps its own async client per model, and the model itself is cached here
+    if isinstance(llm, OpenAIChat) and not isinstance(llm, AzureOpenAI) and llm.http_client is None:
+        llm.http_client = get_llm_http_client()
+    _model_cache[key] = (time.monotonic(), llm)
+    _model_cache.move_to_end(key)
+    if len(_model_cache) > MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+    return llm
+
+
 class SlideGenWorkflow:
     """SlideGenWorkflow class"""
 
@@ -62,26 +221,13 @@ class SlideGenWorkflow:
     async def from_request(cls, request: GeneratePresentationRequest) -> "SlideGenWorkflow":
         """从GeneratePresentationRequest创建工作流实例"""
 
-        llm = await get_llm_instance(request)
-
-        tone_instructions = {
-            "default": "Use a neutral, professional tone",
-            "casual": "Use a friendly, conversational tone",
-            "professional": "Use a formal, professional tone",
-            "funny": "Use a humorous, engaging tone",
-            "educational": "Use a clear, educational tone suitable for learning",
-            "sales_pitch": "Use a persuasive, sales-oriented tone",
-        }
-
-        verbosity_instructions = {
-            "concise": "Keep content brief and to the point",
-            "standard": "Provide balanced content with sufficient detail",
-            "text-heavy": "Provide comprehensive, detailed content",
-        }
+        # Agents are built per request: their instructions depend on the request and agno keeps
+        # per-run tool state on the Agent, so only the model is shared
+        llm = await get_cached_llm_instance(request)
 
         base_instructions = [
-            f"Generate content in {tone_instructions.get(request.tone, 'neutral, professional tone')}",
-            f"Use {verbosity_instructions.get(request.verbosity, 'balanced')} level of detail",
+            f"Generate content in {TONE_INSTRUCTIONS.get(request.tone, 'neutral, professional tone')}",
+            f"Use {VERBOSITY_INSTRUCTIONS.get(request.verbosity, 'balanced')} level of detail",
         ]
 
         if request.instructions:
@@ -100,29 +246,20 @@ class SlideGenWorkflow:
                 f"Create exactly {request.n_slides} slides/sections.",
                 f"Always respond in {request.language}",
             ],
-            expected_output=(
-                "Output the content outline for this PowerPoint section in Markdown, using headings up to level 3 only. Do not use level-4 or deeper headings.\n"
-                "Must follow:\n"
-                "- Top-level (#): Use the current section title and include it exactly once\n"
-                "- Second-level (##): Split this section into 1-4 clear subsections\n"
-                "- Third-level (###): For each subsection, provide 1-4 key points based on the content's depth and relevance\n"
-                "- Output Markdown only; do not add explanations, prefixes, or unrelated text\n"
-                "Example structure (illustrative; do not copy the content):\n"
-                "# PowerPoint Title\n"
-                "## Subsection A\n"
-                "### Key point 1\n"
-                "### Key point 2\n"
-                "## Subsection B\n"
-                "### Key point 1\n"
-                "### Key point 2\n"
-                "### Key point 3\n"
-            ),
+            expected_output=OUTLINE_EXPECTED_OUTPUT,
             model=llm,
         )
 
+        tools = []
+        if request.web_search:
+            # Imported on first use, ddgs is slow to import and most requests do not search the web
+            from agno.tools.duckduckgo import DuckDuckGoTools
+
+            tools.append(DuckDuckGoTools())  # Use duckduckgo to search the internet
+
         content_agent = Agent(
             name="Content writing expert",
-            tools=[DuckDuckGoTools()] if request.web_search else [],  # Use duckduckgo to search the internet
+            tools=tools,
             description="You are a content writing expert. You are responsible for writing detailed content for the provided section titles and key points.",
             instructions=[
                 "Write detailed content based on the provided section titles and key points",
@@ -132,27 +269,7 @@ class SlideGenWorkflow:
                 f"Always respond in {request.language}",
                 *base_instructions,
             ],
-            expected_output=(
-                "You must strictly maintain the original outline structure provided in the input:\n"
-                "- Keep all heading levels (##, ###) exactly as given\n"
-                "- Do NOT change, add, or remove any headings\n"
-                "- Do NOT add numbered lists or bullet points under level-3 headings (###)\n"
-                "- Write content directly as paragraph text under each heading\n"
-                "- Output Markdown only; do not add explanations, prefixes, or unrelated text\n"
-                "\n"
-                "Example:\n"
-                "Input:\n"
-                "## Section A\n"
-                "### Key point 1\n"
-                "### Key point 2\n"
-                "\n"
-                "Output:\n"
-                "## Section A\n"
-                "### Key point 1\n"
-                "Write detailed paragraph content here without using numbered lists or bullet points.\n"
-                "### Key point 2\n"
-                "Write detailed paragraph content here without using numbered lists or bullet points.\n"
-            ),
+            expected_output=CONTENT_EXPECTED_OUTPUT,
             model=llm,
         )
 
@@ -164,79 +281,91 @@ class SlideGenWorkflow:
         """Generate the outline."""
         execution_input = cast(GeneratePresentationRequest, step_input.input)
         # TODO: Input file content
-        outline = await self.outline_agent.arun(execution_input.content)
-        return StepOutput(content=outline.content, success=True)
+        outline = await cached_arun(self.outline_agent, execution_input.content, tag="outline")
 
-    async def section_processor(self, step_input: StepInput) -> StepOutput:
-        """Process each section in the outline."""
+        # Parse the outline once here, the following steps read it from additional_data
+        if step_input.additional_data is not None:
+            step_input.additional_data["outline_doc"] = self.parse_outline(outline, cached=True)
+        return StepOutput(content=outline, success=True)
 
+    def _get_outline_doc(self, step_input: StepInput) -> MarkdownDocument:
+        """Get the outline parsed by the outline step, parsing it only if it was not shared"""
         if step_input.additional_data is None:
             step_input.additional_data = {}
+        doc = step_input.additional_data.get("outline_doc")
+        if doc is None:
+            doc = self.parse_outline(step_input.get_step_content("Outline generation"), cached=True)
+            step_input.additional_data["outline_doc"] = doc
+        return doc
 
-        # Only parse outline and extract sections on the first iteration
-        if "sections" not in step_input.additional_data:
-            outline = step_input.get_step_content("Outline generation")
-            execution_input = cast(GeneratePresentationRequest, step_input.input)
-
-            # Parse the outline, extract each section
-            doc = self.parse_outline(outline)
-            if doc.main is None:
-                return StepOutput(content="No main section found", success=False)
-            sections = [section for section in doc.main.children]
-
-            # If the number of sections does not match the expected number, adjust it
-            if len(sections) != execution_input.n_slides:
-                logger.warning(f"Expected {execution_input.n_slides} sections, got {len(sections)}")
-
-            # Save sections to additional_data for reuse
-            step_input.additional_data["sections"] = sections
-        else:
-            # Reuse parsed sections from previous iterations
-            sections = step_input.additional_data["sections"]
-
-        current_index = int(step_input.additional_data.get("current_section_index", 0))
+    @staticmethod
+    def get_sections(doc: MarkdownDocument) -> list[Element]:
+        """Get the sections to write from the parsed outline"""
+        if doc.main is None:
+            return []
+        return list(islice(doc.main.children, MAX_SECTIONS))
 
-        # initialize the completed sections
-        if "completed_sections" not in step_input.additional_data:
-            step_input.additional_data["completed_sections"] = []
+    async def iter_sections(self, outline: str, sections: list[Element]) -> AsyncIterator[tuple[int, str]]:
+        """Write the sections concurrently, yielding ``(index, content)`` as soon as each one is done
 
-        if current_index < len(sections):
-            current_section = sections[current_index]
+        Sections are written independently so they can run in parallel; the whole outline is given
+        as context instead of the content of the previous sections.
+        """
+        context = SECTION_CONTEXT_TEMPLATE.format(outline=outline)
+        semaphore = asyncio.Semaphore(SECTION_CONCURRENCY)
 
-            # build the context with the previous sections
-            completed_sections = step_input.additional_data["completed_sections"]
-            context_parts = []
+        async def write_section(idx: int, section: Element) -> tuple[int, str]:
+            prompt = f"{context}{section.element_text_source}\n{section.text}."
+            async with semaphore:
+                content = await cached_arun(self.content_agent, prompt, tag="section")
+            logger.debug(f"Completed section: {section.element_text}")
+            return idx, content
 
-            if completed_sections:
-                context_parts.append("The following is the content of the previous sections:\n")
-                for idx, section_data in enumerate(completed_sections):
-                    context_parts.append(f"\n--- Section {idx + 1}: {section_data['title']} ---")
-                    context_parts.append(section_data["content"])
-                context_parts.append("\n\nWrite detailed content for the following powerpoint section:")
+        tasks = [asyncio.ensure_future(write_section(idx, section)) for idx, section in enumerate(sections)]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            # Stop the remaining sections if a section failed or the consumer stopped early
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled sections so none outlives the step and later failures are retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Build the complete prompt
-            context = "\n".join(context_parts) if context_parts else ""
-            prompt = f"{context}\n\n{current_section.element_text_source}\n{current_section.text}."
+    async def section_processor(self, step_input: StepInput) -> StepOutput:
+        """Write the content of every section in the outline concurrently."""
+        outline = step_input.get_step_content("Outline generation")
+        execution_input = cast(GeneratePresentationRequest, step_input.input)
 
-            response = await self.content_agent.arun(prompt)
+        # Extract each section of the parsed outline
+        doc = self._get_outline_doc(step_input)
+        if doc.main is None:
+            return StepOutput(content="No main section found", success=False)
+        sections = self.get_sections(doc)
 
-            # save the current section info
-            section_data = {
-                "title": current_section.element_text,
-                "content": response.content if hasattr(response, "content") else str(response),
-                "index": current_index,
-            }
-            step_input.additional_data["completed_sections"].append(section_data)
-            step_input.additional_data["current_section_index"] = current_index + 1
+        # If the number of sections does not match the expected number, adjust it
+        if len(sections) != execution_input.n_slides:
+            logger.warning(f"Expected {execution_input.n_slides} sections, got {len(sections)}")
 
-            logger.debug(f"Completed section {current_index + 1}/{len(sections)}: {current_section.element_text}")
+        contents = [""] * len(sections)
+        async for idx, content in self.iter_sections(self.outline_text(outline), sections):
+            contents[idx] = content
 
-            return StepOutput(content=response.content, success=True)
+        # The section contents are only passed on through the step output, keeping them out of
+        # additional_data avoids a second copy that agno would serialize with the run
+        return StepOutput(content=contents, success=True)
 
-        return StepOutput(content="All sections processed", success=True, stop=True)
+    @staticmethod
+    def outline_text(outline: str | dict[str, str] | None) -> str:
+        """Get the outline as Markdown text, merging the values of a dict outline"""
+        if outline is None:
+            return ""
+        if isinstance(outline, dict):
+            return "\n".join(v for v in outline.values() if v)
+        return outline
 
     @staticmethod
-    def parse_outline(outline: str | dict[str, str] | None) -> MarkdownDocument:
+    def parse_outline(outline: str | dict[str, str] | None, *, cached: bool = False) -> MarkdownDocument:
         """Parse the outline into a list of sections using MarkdownDocument
 
         Args:
@@ -244,6 +373,8 @@ class SlideGenWorkflow:
                 - str: Markdown text
                 - dict: Dictionary with text values
                 - None: Returns empty MarkdownDocument
+            cached: Reuse the document parsed for an identical outline. The returned document is
+                shared and must not be modified.
 
         Returns:
             MarkdownDocument
@@ -252,14 +383,11 @@ class SlideGenWorkflow:
             return MarkdownDocument(source="")
 
         # Convert dict to string if needed
-        if isinstance(outline, dict):
-            merged = "\n".join(v for v in outline.values() if v)
-        else:
-            merged = outline
+        merged = SlideGenWorkflow.outline_text(outline)
 
         # Parse the outline using MarkdownDocument
         try:
-            doc = MarkdownDocument(merged)
+            doc = _parse_markdown_cached(merged) if cached else MarkdownDocument(merged)
 
             return doc
         except Exception as e:
@@ -267,47 +395,34 @@ class SlideGenWorkflow:
             logger.exception(f"Markdown parsing failed, using fallback: {e!s}")
             raise e
 
-    @staticmethod
-    def check_completion(outputs: list[StepOutput]) -> bool:
-        """Check if all sections are processed"""
-        if not outputs:
-            return False
-        last_output = outputs[-1]
-        if last_output.success and last_output.stop:
-            return True
-        return False
-
     async def merge_sections_processor(self, step_input: StepInput) -> StepOutput:
         """Merge all completed sections into a complete Markdown document"""
         try:
-            # Get outline content
-            outline_content = step_input.get_step_content("Outline generation")
-
-            loop_output = step_input.get_step_output("Loop writing sections")
-            if loop_output is None or loop_output.steps is None:
+            sections_output = step_input.get_step_output("Section writing")
+            if sections_output is None or not sections_output.success or not sections_output.content:
                 return StepOutput(content="No completed sections found", success=False)
-            completed_outputs: list[StepOutput] = loop_output.steps
+            if not isinstance(sections_output.content, list):
+                return StepOutput(content="Section writing did not return a list of sections", success=False)
+            completed_sections: list[str] = sections_output.content
 
             # Build the complete Markdown document
             markdown_parts = []
 
-            # Parse outline to get the title (H1)
-            doc = self.parse_outline(outline_content)
+            # Get the title (H1) from the parsed outline
+            doc = self._get_outline_doc(step_input)
             if doc.main and doc.main.element_text:
                 markdown_parts.append(f"{doc.main.element_text_source}\n")
 
             # Add each section's content
-            for step in completed_outputs:
-                if step.stop:
-                    break
+            for section_content in completed_sections:
                 # Add a blank line between sections for better readability
-                markdown_parts.append(str(step.content))
+                markdown_parts.append(str(section_content))
                 markdown_parts.append("\n")
 
             # Join all parts into a complete Markdown document
             complete_markdown = "\n".join(markdown_parts).strip()
 
-            logger.info(f"Successfully merged {len(completed_outputs)} sections into complete Markdown document")
+            logger.info(f"Successfully merged {len(completed_sections)} sections into complete Markdown document")
 
             return StepOutput(content=complete_markdown, success=True)
 
@@ -318,16 +433,10 @@ class SlideGenWorkflow:
     def create_writing_workflow(self) -> Workflow:
         """Create the writing workflow"""
         return Workflow(
-            name="Loop writing workflow",
-            session_state={"current_section_index": 0},
+            name="Writing workflow",
             steps=[
                 Step(name="Outline generation", executor=self.outline_processor),
-                Loop(
-                    name="Loop writing sections",
-                    steps=[Step(name="Section processing", executor=self.section_processor)],
-                    end_condition=self.check_completion,
-                    max_iterations=MAX_ITERATIONS,
-                ),
+                Step(name="Section writing", executor=self.section_processor),
                 Step(name="Merge sections", executor=self.merge_sections_processor),
             ],
         )
@@ -338,7 +447,8 @@ async def run_slidegen_workflow(request: GeneratePresentationRequest) -> Markdow
     try:
         workflow_instance = await SlideGenWorkflow.from_request(request)
         workflow = workflow_instance.create_writing_workflow()
-        result = await workflow.arun(request)
+        # Share one additional_data dict across all steps so the outline is parsed only once
+        result = await workflow.arun(request, additional_data={})
         last_step_result = result.step_results[-1]
 
         if isinstance(last_step_result, StepOutput):
@@ -1,37 +1,400 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import mimetypes
 import os
+import queue
+import threading
+import urllib.request
 import uuid
-from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+# Response data is collected until it reaches this size, then written to disk with one writev call
+WRITE_BATCH_SIZE = 256 * 1024
+# Most buffers passed to a single writev call, the common IOV_MAX
+WRITEV_MAX_BUFFERS = 1024
+# Number of downloaded URLs remembered, so a URL fetched again into the same directory reuses the file
+URL_CACHE_SIZE = 1024
+# Retries of a download failing with a connection error, timeout, 429 or 5xx, and the first backoff delay
+DOWNLOAD_MAX_RETRIES = 3
+DOWNLOAD_RETRY_BASE_DELAY = 0.2
+# Largest Content-Length preallocated on disk, larger announced sizes grow the file as it is written so a
+# server can't make us reserve space it never sends
+MAX_PREALLOCATE_SIZE = 256 * 1024 * 1024
+# Number of write batches a download may queue ahead of the writer before it waits for the disk
+MAX_PENDING_BATCHES = 8
+
+# Downloaded files are named from a per-process prefix and a counter. The random part of the prefix
+# keeps names unique across processes and restarts that reuse a pid in the same directory
+_FILENAME_PREFIX = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+_FILENAME_COUNTER = itertools.count()
+
+
+def _reset_filename_prefix() -> None:
+    # Forked workers would otherwise inherit the parent's prefix and counter
+    global _FILENAME_PREFIX, _FILENAME_COUNTER
+    _FILENAME_PREFIX = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+    _FILENAME_COUNTER = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_filename_prefix)
+
+# (url, output_directory) -> saved path, least recently used first
+_URL_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+# Output directories already created by this process, so repeated downloads skip the mkdir
+_ENSURED_DIRS: set[str] = set()
+
+# Proxy settings are read from the environment once at import instead of on every request
+_ENV_PROXIES = urllib.request.getproxies()
+# Hosts from NO_PROXY, matched against the URL host and its parent domains
+_NO_PROXY_HOSTS = tuple(
+    name.strip().lstrip(".").lower() for name in _ENV_PROXIES.get("no", "").split(",") if name.strip()
+)
+
+# Downloads share one session so connections and DNS lookups are reused across files
+_session: aiohttp.ClientSession | None = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared download session, creating it on first use inside the running event loop."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            # No overall limit so large files can finish, but stalled connections and reads fail
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=60),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared download session. Call on application shutdown."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def proxy_for(url: str) -> str | None:
+    """Return the environment proxy to use for the URL, honouring NO_PROXY."""
+    parts = urlsplit(url)
+    proxy = _ENV_PROXIES.get(parts.scheme)
+    if not proxy:
+        return None
+    host = (parts.hostname or "").lower()
+    if "*" in _NO_PROXY_HOSTS or any(host == name or host.endswith(f".{name}") for name in _NO_PROXY_HOSTS):
+        return None
+    return proxy
+
+
+def _ensure_directory(directory: str) -> None:
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+def _open_for_download(filepath: str, size: int | None) -> int:
+    """Open the target file for writing, preallocating `size` bytes when the size is known and not too large."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(filepath, flags, 0o644)
+    except FileNotFoundError:
+        # The directory was removed after it was first ensured
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        fd = os.open(filepath, flags, 0o644)
+    if size and size <= MAX_PREALLOCATE_SIZE and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Preallocation is only a layout hint, on failure (e.g. no space left) the writes report the error
+            pass
+    return fd
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _writev_all(fd: int, buffers: list[bytes]) -> None:
+    """Write the buffers in order, with as few writev calls as the kernel allows."""
+    if not hasattr(os, "writev"):
+        for data in buffers:
+            _write_all(fd, data)
+        return
+    views = [memoryview(data) for data in buffers]
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start : start + WRITEV_MAX_BUFFERS])
+        # Skip the buffers written in full and resume a partially written one
+        while start < len(views) and written >= len(views[start]):
+            written -= len(views[start])
+            start += 1
+        if written:
+            views[start] = views[start][written:]
+
+
+def _set_future_result(future: asyncio.Future[Any], result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future[Any], exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+class AsyncArtifactWriter:
+    """Runs file operations queued from the event loop on a background thread, in queue order.
+
+    Writes are queued without waiting for them, so a download keeps reading from the network while
+    its earlier chunks are written to disk. `run` queues an operation and waits for its result,
+    `flush` waits until everything queued before it is done.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[tuple[Callable[[], Any], asyncio.Future[Any] | None]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._work, name="artifact-writer", daemon=True)
+                self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            func, future = self._queue.get()
+            try:
+                result = func()
+            except BaseException as e:
+                if future is None:
+                    logger.exception("Queued file operation failed")
+                else:
+                    future.get_loop().call_soon_threadsafe(_set_future_exception, future, e)
+            else:
+                if future is not None:
+                    future.get_loop().call_soon_threadsafe(_set_future_result, future, result)
+
+    def submit(self, func: Callable[[], Any]) -> None:
+        """Queue an operation without waiting for it."""
+        self._ensure_thread()
+        self._queue.put((func, None))
+
+    async def run(self, func: Callable[[], Any]) -> Any:
+        """Queue an operation and wait for its result."""
+        self._ensure_thread()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put((func, future))
+        return await future
+
+    async def flush(self) -> None:
+        """Wait until every operation queued so far has been performed."""
+        await self.run(lambda: None)
+
+
+artifact_writer = AsyncArtifactWriter()
+
+
+@dataclass
+class _DownloadTarget:
+    """An open download file, only touched from the writer thread"""
+
+    fd: int = -1
+    written: int = 0
+    error: OSError | None = None
+
+
+def _write_batch(target: _DownloadTarget, chunks: list[bytes], size: int) -> None:
+    # Errors are kept and raised when the file is closed, later batches of a failed file are dropped
+    if target.error is not None:
+        return
+    try:
+        _writev_all(target.fd, chunks)
+        target.written += size
+    except OSError as e:
+        target.error = e
+
+
+def _open_target(target: _DownloadTarget, filepath: str, size: int | None) -> None:
+    target.fd = _open_for_download(filepath, size)
+
+
+def _discard_download(target: _DownloadTarget, filepath: str) -> None:
+    if target.fd >= 0:
+        os.close(target.fd)
+        target.fd = -1
+    _remove_quietly(filepath)
+
+
+def _close_download(target: _DownloadTarget, size: int | None) -> None:
+    try:
+        if target.error is None and size and target.written != size:
+            # Drop the unused part of the preallocation
+            os.ftruncate(target.fd, target.written)
+    finally:
+        os.close(target.fd)
+    if target.error is not None:
+        raise target.error
+
+
+def _guess_suffix(url: str, content_type: str | None) -> str:
+    """Pick the file extension from the response Content-Type, then the URL path."""
+    if content_type and content_type != "application/octet-stream":
+        suffix = mimetypes.guess_extension(content_type)
+        if suffix:
+            return suffix
+    return os.path.splitext(urlsplit(url).path)[1] or ".bin"
+
+
+def _remove_quietly(filepath: str) -> None:
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
+
+def _is_retryable(error: BaseException) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, aiohttp.ClientConnectionError | aiohttp.ClientPayloadError | TimeoutError)
+
+
+def _log_retry(url: str, retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = retry_state.next_action.sleep if retry_state.next_action else 0
+    logger.warning(
+        f"Download failed, retrying in {delay:.1f}s ({retry_state.attempt_number}/{DOWNLOAD_MAX_RETRIES}): {url}: {error!s}"
+    )
+
+
+async def _fetch_to_file(url: str, output_directory: str) -> str:
+    """Download the URL once into a new file in the directory, removing the file if the download fails."""
+    async with get_session().get(url, proxy=proxy_for(url)) as resp:
+        resp.raise_for_status()
+        # aiohttp reports a missing Content-Type as application/octet-stream
+        filename = f"{_FILENAME_PREFIX}_{next(_FILENAME_COUNTER):08x}{_guess_suffix(url, resp.content_type)}"
+        filepath = os.path.join(output_directory, filename)
+        # Content-Length is the encoded size when aiohttp decompresses the body
+        size = resp.content_length if "Content-Encoding" not in resp.headers else None
+        target = _DownloadTarget()
+        try:
+            await artifact_writer.run(partial(_open_target, target, filepath, size))
+        except BaseException:
+            # A cancelled wait doesn't stop the queued open, close what it opened once it has run
+            artifact_writer.submit(partial(_discard_download, target, filepath))
+            raise
+        try:
+            try:
+                # The body is streamed to disk in batches, each written with one writev call on the
+                # artifact writer thread, so disk writes block neither the event loop nor the download
+                queued = 0
+                batch: list[bytes] = []
+                batch_size = 0
+                async for chunk in resp.content.iter_any():
+                    batch.append(chunk)
+                    batch_size += len(chunk)
+                    if batch_size < WRITE_BATCH_SIZE:
+                        continue
+                    artifact_writer.submit(partial(_write_batch, target, batch, batch_size))
+                    batch = []
+                    batch_size = 0
+                    queued += 1
+                    if queued % MAX_PENDING_BATCHES == 0:
+                        # Bound the memory held by queued batches when the disk is slower than the network
+                        await artifact_writer.flush()
+                if batch:
+                    artifact_writer.submit(partial(_write_batch, target, batch, batch_size))
+            finally:
+                await artifact_writer.run(partial(_close_download, target, size))
+        except BaseException:
+            # Don't leave a partial file behind
+            artifact_writer.submit(partial(_remove_quietly, filepath))
+            raise
+    return filepath
 
 
 async def download_file(url: str, output_directory: str) -> str:
     """download file from URL and save to specified directory, return saved path.
 
-    - use aiohttp to download asynchronously
+    - use aiohttp to download asynchronously, through the shared session
     - if directory does not exist, create it
-    - file name uses uuid, preserves original extension (if any)
+    - file name is unique, the extension comes from the Content-Type, else the URL path, else ".bin"
+    - a URL already downloaded into the same directory returns the existing file
+    - transient failures are retried
     """
-    try:
-        Path(output_directory).mkdir(parents=True, exist_ok=True)
+    key = (url, output_directory)
+    cached = _URL_CACHE.get(key)
+    if cached is not None:
+        if os.path.exists(cached):
+            _URL_CACHE.move_to_end(key)
+            return cached
+        del _URL_CACHE[key]
 
-        suffix = Path(url).suffix or ".jpg"
-        filename = f"{uuid.uuid4()}{suffix}"
-        filepath = os.path.join(output_directory, filename)
+    try:
+        _ensure_directory(output_directory)
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url) as resp:
-                resp.raise_for_status()
-                content = await resp.read()
+        # Connection errors, timeouts, 429 and 5xx responses are retried with jittered exponential backoff
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(DOWNLOAD_MAX_RETRIES + 1),
+            wait=wait_exponential(multiplier=DOWNLOAD_RETRY_BASE_DELAY) + wait_random(0, DOWNLOAD_RETRY_BASE_DELAY),
+            retry=retry_if_exception(_is_retryable),
+            before_sleep=partial(_log_retry, url),
+            reraise=True,
+        ):
+            with attempt:
+                filepath = await _fetch_to_file(url, output_directory)
 
-        with open(filepath, "wb") as f:
-            f.write(content)
+        _URL_CACHE[key] = filepath
+        if len(_URL_CACHE) > URL_CACHE_SIZE:
+            _URL_CACHE.popitem(last=False)
 
         logger.info(f"Download completed: {url} -> {filepath}")
         return filepath
     except Exception:
         logger.exception(f"Download failed: {url}")
         raise
+
+
+async def download_files(urls: list[str], output_directory: str, concurrency: int = 32) -> list[str]:
+    """download several files concurrently into the specified directory, return saved paths in input order.
+
+    - at most `concurrency` downloads are in flight at once, all through the shared session
+    - if any download fails the remaining ones are cancelled and the errors are raised as an ExceptionGroup
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _download(url: str) -> str:
+        async with semaphore:
+            return await download_file(url, output_directory)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_download(url)) for url in urls]
+    return [task.result() for task in tasks]
@@ -1,6 +1,5 @@
 import re
 from copy import deepcopy
-from types import SimpleNamespace
 from typing import Any
 
 from lxml import etree
@@ -43,6 +42,31 @@ IMAGE_EXTENSIONS: set[str] = {
     "webp",
 }
 
+ENGLISH_PATTERN = re.compile(r"[ `a-zA-Z.,':;/\"?<>!\(\)-]")
+CHINESE_PATTERN = re.compile("[\u4e00-\u9fff]")
+HEX_COLOR_PATTERN = re.compile("[0-9a-fA-F]+")
+
+DRAWINGML_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PRESENTATIONML_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NSMAP = {"a": DRAWINGML_NS, "p": PRESENTATIONML_NS}
+
+# Compiled once instead of re-parsing the expressions on every call
+_COLOR_SCHEME_XP = etree.XPath("a:themeElements/a:clrScheme/*", namespaces=NSMAP)
+_SRGB_VAL_XP = etree.XPath(".//a:srgbClr/@val", namespaces=NSMAP)
+_CNVPR_XP = etree.XPath(".//p:cNvPr", namespaces=NSMAP)
+_P_XP = etree.XPath(".//a:p", namespaces=NSMAP)
+_T_XP = etree.XPath(".//a:t", namespaces=NSMAP)
+_RPR_XP = etree.XPath(".//a:rPr", namespaces=NSMAP)
+_PPR_XP = etree.XPath(".//a:pPr", namespaces=NSMAP)
+_END_PARA_RPR_XP = etree.XPath(".//a:endParaRPr", namespaces=NSMAP)
+
+_P_TAG = etree.QName(DRAWINGML_NS, "p").text
+_FLD_TAG = etree.QName(DRAWINGML_NS, "fld").text
+_PPR_TAG = etree.QName(DRAWINGML_NS, "pPr").text
+_R_TAG = etree.QName(DRAWINGML_NS, "r").text
+_T_TAG = etree.QName(DRAWINGML_NS, "t").text
+_RPR_TAG = etree.QName(DRAWINGML_NS, "rPr").text
+
 
 def is_image_path(file: str | None) -> bool:
     """
@@ -64,7 +88,7 @@ def is_english(texts: list[str]) -> bool:
     if not texts:
         return False
     for t in texts:
-        if re.match(r"[ `a-zA-Z.,':;/\"?<>!\(\)-]", t.strip()):
+        if ENGLISH_PATTERN.match(t.strip()):
             eng += 1
     if eng / len(texts) > 0.8:
         return True
@@ -74,10 +98,8 @@ def is_english(texts: list[str]) -> bool:
 def is_chinese(text: str) -> bool:
     if not text:
         return False
-    chinese = 0
-    for ch in text:
-        if "\u4e00" <= ch <= "\u9fff":
-            chinese += 1
+    # Scan in C with the compiled pattern instead of comparing chars in Python
+    chinese = len(CHINESE_PATTERN.findall(text))
     if chinese / len(text) > 0.2:
         return True
     return False
@@ -93,22 +115,23 @@ def get_font_style(font: dict[str, Any]) -> str:
     Returns:
         str: The CSS style string.
     """
-    font = SimpleNamespace(**font)  # type: ignore
     styles = []
 
-    if hasattr(font, "size") and font.size:
-        styles.append(f"font-size: {font.size}pt")
+    size = font.get("size")
+    if size:
+        styles.append(f"font-size: {size}pt")
 
-    if hasattr(font, "color") and font.color:
-        if all(c in "0123456789abcdefABCDEF" for c in font.color):
-            styles.append(f"color: #{font.color}")
+    color = font.get("color")
+    if color:
+        if HEX_COLOR_PATTERN.fullmatch(color):
+            styles.append(f"color: #{color}")
         else:
-            styles.append(f"color: {font.color}")
+            styles.append(f"color: {color}")
 
-    if hasattr(font, "bold") and font.bold:
+    if font.get("bold"):
         styles.append("font-weight: bold")
 
-    if hasattr(font, "italic") and font.italic:
+    if font.get("italic"):
         styles.append("font-style: italic")
 
     return "; ".join(styles)
@@ -126,7 +149,13 @@ def runs_merge(paragraph: _Paragraph) -> _Run | None:
     """
     runs = paragraph.runs
     if len(runs) == 0:
-        runs = tuple(_Run(r, paragraph) for r in parse_xml(paragraph._element.xml.replace("fld", "r")).r_lst)
+        # Turn text fields (e.g. slide numbers) into regular runs in place
+        for fld in list(paragraph._element.iterchildren(_FLD_TAG)):
+            r = paragraph._element.makeelement(_R_TAG)
+            r.extend(child for child in list(fld) if child.tag != _PPR_TAG)
+            fld.addnext(r)
+            paragraph._element.remove(fld)
+        runs = tuple(_Run(r, paragraph) for r in paragraph._element.r_lst)
     if len(runs) == 1:
         return runs[0]
     if len(runs) == 0:
@@ -166,52 +195,68 @@ def add_para_by_xml(shape: Shape, xml: str) -> Shape:
 def get_theme_colors(presentation: Presentation) -> dict[str, str]:
     theme_part = presentation.slide_master.part.part_related_by(RT.THEME)
     theme = parse_xml(theme_part.blob)
-    color_elements = theme.xpath("a:themeElements/a:clrScheme/*")
     result = {}
-    for element in color_elements:
-        namespaces = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
-        root = etree.fromstring(etree.tostring(element))
-        theme_name = element.tag.replace("{http://schemas.openxmlformats.org/drawingml/2006/main}", "")
-        result[theme_name] = root.xpath("//a:srgbClr/@val", namespaces=namespaces)[0]
+    for element in _COLOR_SCHEME_XP(theme):
+        theme_name = etree.QName(element).localname
+        values = _SRGB_VAL_XP(element)
+        if values:
+            result[theme_name] = values[0]
     return result
 
 
-def modify_shape_xml(xml_str: str, shape_id: int | str, shape_name: str, text_content: str) -> str:
+def _build_shape_element(
+    root: etree._Element, shape_id: int | str, shape_name: str, text_content: str
+) -> etree._Element:
     """
-    Modify the XML of a PPTX shape: update the shape ID, name, and text content.
+    Update the shape ID, name, and text content in the parsed XML of a PPTX shape.
 
     Args:
-        xml_str (str): The input XML string.
+        root (etree._Element): The parsed shape XML, modified in place.
         shape_id (int | str): The new shape ID.
         shape_name (str): The new shape name.
         text_content (str): The new text content.
 
     Returns:
-        str: The modified XML string.
+        etree._Element: The modified shape element.
     """
-    root = etree.fromstring(xml_str)
-    nsmap = root.nsmap
-
-    cNvPr = root.find(".//p:cNvPr", namespaces=nsmap)
-    if cNvPr is not None:
-        cNvPr.set("id", str(shape_id))
-        cNvPr.set("name", shape_name)
+    cNvPr = _CNVPR_XP(root)
+    if cNvPr:
+        cNvPr[0].set("id", str(shape_id))
+        cNvPr[0].set("name", shape_name)
 
-    t_element = root.find(".//a:t", namespaces=nsmap)
-    if t_element is not None:
+    t_elements = _T_XP(root)
+    if t_elements:
         # Keep the original rPr format
-        r_element = t_element.getparent()
+        r_element = t_elements[0].getparent()
         if r_element is not None:
-            r_pr = r_element.find(".//a:rPr", namespaces=nsmap)
-            if r_pr is not None:
-                new_r = etree.Element(f"{{{nsmap['a']}}}r")
-                new_r.append(deepcopy(r_pr))
-                new_t = etree.Element(f"{{{nsmap['a']}}}t")
+            r_pr = _RPR_XP(r_element)
+            if r_pr:
+                new_r = root.makeelement(_R_TAG)
+                new_r.append(deepcopy(r_pr[0]))
+                new_t = root.makeelement(_T_TAG)
                 new_t.text = text_content
                 new_r.append(new_t)
 
                 p_element = r_element.getparent()
                 p_element.replace(r_element, new_r)
+    return root
+
+
+def modify_shape_xml(xml_str: str, shape_id: int | str, shape_name: str, text_content: str) -> str:
+    """
+    Modify the XML of a PPTX shape: update the shape ID, name, and text content.
+
+    Args:
+        xml_str (str): The input XML string.
+        shape_id (int | str): The new shape ID.
+        shape_name (str): The new shape name.
+        text_content (str): The new text content.
+
+    Returns:
+        str: The modified XML string.
+    """
+    # Parsed without python-pptx's parser, which drops blank text and so changes the pretty printed output
+    root = _build_shape_element(etree.fromstring(xml_str), shape_id, shape_name, text_content)
     return etree.tostring(root, encoding="unicode", pretty_print=True)
 
 
@@ -237,11 +282,10 @@ def add_shape_by_xml(
     Returns:
         Shape: The added shape.
     """
-    shape_xml = modify_shape_xml(shape_xml, shape_id, shape_name, text_content)
+    # Insert the edited element directly instead of serializing and parsing it again
+    shape_element = _build_shape_element(parse_xml(shape_xml), shape_id, shape_name, text_content)
 
-    new_shape = slide.shapes._shape_factory(
-        slide.shapes._spTree.insert_element_before(parse_xml(shape_xml), "p:extLst")
-    )
+    new_shape = slide.shapes._shape_factory(slide.shapes._spTree.insert_element_before(shape_element, "p:extLst"))
     if location is not None:
         new_shape.left = Length(location.x)
         new_shape.top = Length(location.y)
@@ -272,31 +316,32 @@ def convert_paragraph_xml(paragraph_xml: str, text_content: str) -> str:
         str: The converted paragraph xml.
     """
     root = etree.fromstring(paragraph_xml)
-    drawingml_ns = root.nsmap.get("a")
-    if root.tag == f"{{{drawingml_ns}}}p":
+    if root.tag == _P_TAG:
         p_element = root
     else:
-        p_element = root.find(".//a:p", namespaces=root.nsmap)
-    if p_element is None:
-        return etree.tostring(root, encoding="unicode", pretty_print=True)
-
-    end_para_rpr = p_element.find(".//a:endParaRPr", namespaces=root.nsmap)
-    if end_para_rpr is not None:
-        r_pr = etree.Element(f"{{{drawingml_ns}}}rPr")
+        p_elements = _P_XP(root)
+        if not p_elements:
+            return etree.tostring(root, encoding="unicode", pretty_print=True)
+        p_element = p_elements[0]
+
+    end_para_rprs = _END_PARA_RPR_XP(p_element)
+    if end_para_rprs:
+        end_para_rpr = end_para_rprs[0]
+        r_pr = etree.Element(_RPR_TAG)
         for attr, value in end_para_rpr.attrib.items():
             r_pr.set(attr, value)
         for child in end_para_rpr:
             r_pr.append(deepcopy(child))
-        r_element = etree.Element(f"{{{drawingml_ns}}}r")
+        r_element = etree.Element(_R_TAG)
         r_element.append(r_pr)
-        t_element = etree.Element(f"{{{drawingml_ns}}}t")
+        t_element = etree.Element(_T_TAG)
         t_element.text = text_content
         r_element.append(t_element)
         p_element.remove(end_para_rpr)
 
-        p_pr = p_element.find(".//a:pPr", namespaces=root.nsmap)
-        if p_pr is not None:
-            p_pr.addnext(r_element)
+        p_pr = _PPR_XP(p_element)
+        if p_pr:
+            p_pr[0].addnext(r_element)
         else:
             p_element.insert(0, r_element)
 
@@ -0,0 +1,141 @@
+"""Test download helpers"""
+
+import os
+from collections import OrderedDict
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientPayloadError, ClientResponseError, web
+from aiohttp.test_utils import TestServer
+from loguru import logger
+
+from slidegen.workflows.utils import download_helpers
+
+IMAGE_BODY = os.urandom(512 * 1024 + 17)
+
+
+class TestDownloadFile:
+    """Test download_file against a local aiohttp server"""
+
+    @pytest.fixture(autouse=True)
+    def isolate_module_state(self, monkeypatch):
+        """Start every test with an empty URL cache, no proxy and no backoff delay"""
+        monkeypatch.setattr(download_helpers, "_URL_CACHE", OrderedDict())
+        monkeypatch.setattr(download_helpers, "_ENV_PROXIES", {})
+        monkeypatch.setattr(download_helpers, "DOWNLOAD_RETRY_BASE_DELAY", 0)
+
+    @pytest_asyncio.fixture
+    async def server(self):
+        """Serve test responses and count the requests made to each path"""
+        hits: dict[str, int] = {}
+        failures = {"/flaky.png": 2}
+
+        async def handle(request: web.Request) -> web.StreamResponse:
+            hits[request.path] = hits.get(request.path, 0) + 1
+            if request.path == "/image":
+                return web.Response(body=IMAGE_BODY, content_type="image/png")
+            if request.path == "/flaky.png" and hits[request.path] <= failures["/flaky.png"]:
+                return web.Response(status=503)
+            if request.path == "/flaky.png":
+                return web.Response(body=b"GIF89a", content_type="image/gif")
+            if request.path == "/unavailable.png":
+                return web.Response(status=503)
+            if request.path == "/truncated.png":
+                response = web.StreamResponse(headers={"Content-Type": "image/png", "Content-Length": "100000"})
+                await response.prepare(request)
+                await response.write(b"x" * 1000)
+                # Close the connection before the announced length was sent
+                request.transport.close()
+                return response
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_get("/{name:.*}", handle)
+        test_server = TestServer(app, host="127.0.0.1")
+        await test_server.start_server()
+        test_server.hits = hits
+        yield test_server
+        await download_helpers.close_session()
+        await test_server.close()
+
+    @pytest.mark.asyncio
+    async def test_download_file(self, server, tmp_path):
+        """Test the body is saved to a new file in a created directory"""
+        output_directory = str(tmp_path / "images")
+
+        path = await download_helpers.download_file(str(server.make_url("/image")), output_directory)
+
+        assert os.path.dirname(path) == output_directory
+        with open(path, "rb") as f:
+            assert f.read() == IMAGE_BODY
+        logger.info(f"Successfully downloaded file: {path}")
+
+    @pytest.mark.asyncio
+    async def test_suffix_from_content_type(self, server, tmp_path):
+        """Test the extension comes from the Content-Type, not the URL path"""
+        path = await download_helpers.download_file(str(server.make_url("/image")), str(tmp_path))
+
+        assert path.endswith(".png")
+        logger.info("Successfully took the file extension from the Content-Type")
+
+    @pytest.mark.asyncio
+    async def test_url_cache_reuses_file(self, server, tmp_path):
+        """Test a URL downloaded again into the same directory returns the saved file"""
+        url = str(server.make_url("/image"))
+
+        first = await download_helpers.download_file(url, str(tmp_path))
+        second = await download_helpers.download_file(url, str(tmp_path))
+
+        assert first == second
+        assert server.hits["/image"] == 1
+
+        # The file is downloaded again once the cached file is gone
+        os.remove(first)
+        third = await download_helpers.download_file(url, str(tmp_path))
+        assert os.path.exists(third)
+        assert server.hits["/image"] == 2
+        logger.info("Successfully reused the URL cache")
+
+    @pytest.mark.asyncio
+    async def test_retry_server_error(self, server, tmp_path):
+        """Test 5xx responses are retried until the download succeeds"""
+        path = await download_helpers.download_file(str(server.make_url("/flaky.png")), str(tmp_path))
+
+        assert server.hits["/flaky.png"] == 3
+        with open(path, "rb") as f:
+            assert f.read() == b"GIF89a"
+        logger.info("Successfully retried a server error")
+
+    @pytest.mark.asyncio
+    async def test_retry_gives_up(self, server, tmp_path):
+        """Test a persistent 5xx is raised after the last retry"""
+        with pytest.raises(ClientResponseError) as exc_info:
+            await download_helpers.download_file(str(server.make_url("/unavailable.png")), str(tmp_path))
+
+        assert exc_info.value.status == 503
+        assert server.hits["/unavailable.png"] == download_helpers.DOWNLOAD_MAX_RETRIES + 1
+        assert os.listdir(tmp_path) == []
+        logger.info("Successfully gave up after the last retry")
+
+    @pytest.mark.asyncio
+    async def test_no_retry_client_error(self, server, tmp_path):
+        """Test 4xx responses are raised without retrying"""
+        with pytest.raises(ClientResponseError) as exc_info:
+            await download_helpers.download_file(str(server.make_url("/missing.png")), str(tmp_path))
+
+        assert exc_info.value.status == 404
+        assert server.hits["/missing.png"] == 1
+        logger.info("Successfully raised a client error without retrying")
+
+    @pytest.mark.asyncio
+    async def test_partial_file_removed(self, server, tmp_path, monkeypatch):
+        """Test the partial file of a failed download is deleted"""
+        monkeypatch.setattr(download_helpers, "DOWNLOAD_MAX_RETRIES", 0)
+
+        with pytest.raises(ClientPayloadError):
+            await download_helpers.download_file(str(server.make_url("/truncated.png")), str(tmp_path))
+
+        # The removal is queued on the artifact writer
+        await download_helpers.artifact_writer.flush()
+        assert os.listdir(tmp_path) == []
+        logger.info("Successfully removed the partial file")
@@ -0,0 +1,76 @@
+"""Test the LLM configuration lookup"""
+
+import datetime
+import uuid
+
+import pytest
+from loguru import logger
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel
+
+import slidegen.workflows.presentation  # noqa: F401  # imported first to avoid a circular import
+from slidegen.models.llm_config import LLMConfigModel
+from slidegen.models.user import UserModel
+from slidegen.workflows.slidegen import _DEFAULT_LLM_CONFIG_STMT, _LLM_CONFIG_STMT
+
+
+class TestLLMConfigLookup:
+    """Test the user-or-default LLM configuration queries against SQLite"""
+
+    @pytest.fixture
+    def session(self):
+        """Create an in-memory database with the user and LLM config tables"""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[UserModel.__table__, LLMConfigModel.__table__])
+        with Session(engine) as session:
+            yield session
+
+    @staticmethod
+    def _add_config(session: Session, user_id: uuid.UUID, name: str, **kwargs) -> LLMConfigModel:
+        now = datetime.datetime.now(datetime.UTC)
+        config = LLMConfigModel(
+            name=name,
+            provider="openai",
+            model_id=name,
+            user_id=user_id,
+            create_time=now,
+            update_time=now,
+            **kwargs,
+        )
+        session.add(config)
+        session.commit()
+        return config
+
+    def test_user_specific_config(self, session):
+        """Test the requested config is returned over the user's default"""
+        user_id = uuid.uuid4()
+        self._add_config(session, user_id, "default", is_default=True)
+        requested = self._add_config(session, user_id, "requested")
+
+        config = session.scalar(_LLM_CONFIG_STMT, {"user_id": user_id, "config_id": requested.id})
+
+        assert config.name == "requested"
+        logger.info("Successfully resolved the requested config")
+
+    def test_default_only(self, session):
+        """Test the user's default is returned when the requested config is missing or inactive"""
+        user_id = uuid.uuid4()
+        self._add_config(session, user_id, "default", is_default=True)
+        inactive = self._add_config(session, user_id, "inactive", is_active=False)
+        other_user = self._add_config(session, uuid.uuid4(), "other")
+
+        for config_id in (inactive.id, other_user.id, uuid.uuid4()):
+            config = session.scalar(_LLM_CONFIG_STMT, {"user_id": user_id, "config_id": config_id})
+            assert config.name == "default"
+        assert session.scalar(_DEFAULT_LLM_CONFIG_STMT, {"user_id": user_id}).name == "default"
+        logger.info("Successfully fell back to the default config")
+
+    def test_neither(self, session):
+        """Test nothing is returned without a matching or default config"""
+        user_id = uuid.uuid4()
+        self._add_config(session, user_id, "plain")
+        self._add_config(session, user_id, "inactive default", is_default=True, is_active=False)
+
+        assert session.scalar(_LLM_CONFIG_STMT, {"user_id": user_id, "config_id": uuid.uuid4()}) is None
+        assert session.scalar(_DEFAULT_LLM_CONFIG_STMT, {"user_id": user_id}) is None
+        logger.info("Successfully found no config")
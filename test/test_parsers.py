@@ -1,6 +1,7 @@
 """Test parsers"""
 
 import os
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -88,18 +89,25 @@ class TestTextParser:
 class TestPdfParser:
     """Test PdfParser"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def pdf_parser(self):
         """Create PdfParser instance"""
         return PdfParser()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def test_pdf_file(self):
         """Test pdf file path"""
         test_dir = Path(__file__).parent / "data"
         pdf_file = test_dir / "Introduction.to.KAG-en-tc-20241111.pdf"
         return str(pdf_file)
 
+    @pytest.fixture(scope="session")
+    def pdf_result(self, pdf_parser, test_pdf_file):
+        """Parse the test pdf file once for all tests"""
+        if not os.path.exists(test_pdf_file):
+            pytest.skip(f"Test file not found: {test_pdf_file}")
+        return pdf_parser.convert(test_pdf_file, file_extension=".pdf")
+
     def test_get_supported_content_types(self, pdf_parser):
         """Test get supported content types"""
         content_types = pdf_parser.get_supported_content_types()
@@ -107,12 +115,9 @@ class TestPdfParser:
         assert content_types[0].value == ".pdf"
         logger.info(f"PdfParser supported content types: {[ct.value for ct in content_types]}")
 
-    def test_convert_pdf_file(self, pdf_parser, test_pdf_file):
+    def test_convert_pdf_file(self, pdf_result):
         """Test convert pdf file"""
-        if not os.path.exists(test_pdf_file):
-            pytest.skip(f"Test file not found: {test_pdf_file}")
-
-        result = pdf_parser.convert(test_pdf_file, file_extension=".pdf")
+        result = pdf_result
 
         assert result is not None
         assert isinstance(result, DocumentParseResult)
@@ -246,6 +251,62 @@ class TestDocumentReader:
         assert len(result.text_content) > 0
         logger.info("DocumentReader successfully used stream to convert file")
 
+    def test_convert_normalizes_text_and_markdown(self, converter, tmp_path):
+        """Test trailing spaces are stripped and blank line runs collapsed for text and markdown"""
+        for name in ("notes.txt", "notes.md"):
+            path = tmp_path / name
+            path.write_text("a  \n\n\n\nb\t\nc", encoding="utf-8")
+
+            result = converter.convert_local(str(path))
+
+            assert result.text_content == "a\n\nb\nc"
+        logger.info("DocumentReader normalized text and markdown output")
+
+    def test_guess_ext_magic_signature(self, converter, tmp_path):
+        """Test common file signatures are detected without a file extension"""
+        html_file = tmp_path / "page"
+        html_file.write_bytes(b"<!DOCTYPE html><html><body>Hello</body></html>")
+        pdf_file = tmp_path / "document"
+        pdf_file.write_bytes(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+        assert converter._guess_ext_magic(str(html_file)) == [".html"]
+        assert converter._guess_ext_magic(str(pdf_file)) == [".pdf"]
+        logger.info("Successfully detected file signatures")
+
+    def test_guess_ext_magic_ooxml(self, converter, tmp_path):
+        """Test Office Open XML packages are told apart by their main part"""
+        for main_part, expected in (
+            ("word/document.xml", ".docx"),
+            ("xl/workbook.xml", ".xlsx"),
+            ("ppt/presentation.xml", ".pptx"),
+        ):
+            package = tmp_path / expected.lstrip(".")
+            with zipfile.ZipFile(package, "w") as archive:
+                archive.writestr("[Content_Types].xml", "<Types/>")
+                archive.writestr(main_part, "<root/>")
+
+            assert converter._guess_ext_magic(str(package)) == [expected]
+        logger.info("Successfully detected Office Open XML packages")
+
+    def test_guess_ext_magic_plain_zip(self, converter, tmp_path):
+        """Test a ZIP without an Office main part is left to puremagic"""
+        archive_file = tmp_path / "archive"
+        with zipfile.ZipFile(archive_file, "w") as archive:
+            archive.writestr("readme.txt", "hello")
+
+        assert converter._guess_ext_signature(str(archive_file), archive_file.read_bytes()) == []
+        assert ".zip" in converter._guess_ext_magic(str(archive_file))
+        logger.info("Successfully left a plain zip to puremagic")
+
+    def test_guess_ext_magic_ole(self, converter, tmp_path):
+        """Test OLE compound files are reported as both .xls and .doc"""
+        ole_file = tmp_path / "legacy"
+        ole_file.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 504)
+
+        # The signature can't tell the two apart, the parsers decide by trying them in order
+        assert converter._guess_ext_magic(str(ole_file)) == [".xls", ".doc"]
+        logger.info("Successfully detected an OLE compound file")
+
     def test_parser_registration_order(self, converter):
         """Test parser registration order"""
         # Register a new parser
@@ -280,9 +341,8 @@ class TestParserEdgeCases:
         parser = TextParser()
         large_file = tmp_path / "large.txt"
 
-        # Create a larger file (about 1MB)
-        large_content = "This is a test content.\n" * 50000
-        large_file.write_text(large_content, encoding="utf-8")
+        # Create a larger file (about 1MB), written as bytes to skip the text encoding pass
+        large_file.write_bytes(b"This is a test content.\n" * 50000)
 
         result = parser.convert(str(large_file), file_extension=".txt")
 
@@ -1,3 +1,4 @@
+import copy
 import os
 import sys
 
@@ -17,25 +18,34 @@ from slidegen.core.pptgen.pptpages import CatalogPage, ChapterContentPage, Chapt
 class TestSlideGen:
     """SlideGen核心功能测试类"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def markdown_path(self):
         """返回测试Markdown文件路径"""
         return os.path.join(os.path.dirname(__file__), "data", "report.md")
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def template_path(self):
         """返回测试PPT模板路径"""
         return os.path.join(os.path.dirname(__file__), "data", "DeepSeek对中国AI产业的影响.pptx")
 
-    @pytest.fixture
-    def presentation(self, template_path):
-        """创建一个Presentation对象"""
+    @pytest.fixture(scope="session")
+    def template_presentation(self, template_path):
+        """只解析一次PPT模板，供所有测试复制使用"""
         return Presentation(template_path)
 
-    def test_markdown_document_parse(self, markdown_path):
+    @pytest.fixture
+    def presentation(self, template_presentation):
+        """创建一个Presentation对象，每个测试使用模板的独立副本"""
+        return copy.deepcopy(template_presentation)
+
+    @pytest.fixture(scope="session")
+    def markdown_document(self, markdown_path):
+        """只解析一次Markdown文档，测试中只读取不修改"""
+        return MarkdownDocument(markdown_path)
+
+    def test_markdown_document_parse(self, markdown_document):
         """测试Markdown文档解析功能"""
-        # 创建MarkdownDocument对象
-        doc = MarkdownDocument(markdown_path)
+        doc = markdown_document
 
         # 验证文档是否正确解析
         assert doc is not None
@@ -43,11 +53,6 @@ class TestSlideGen:
         headings = [elem for elem in doc.main.children]
         assert len(headings) > 0
 
-    @pytest.fixture
-    def markdown_document(self, markdown_path):
-        doc = MarkdownDocument(markdown_path)
-        return doc
-
     @pytest.fixture
     def heading_list(self, markdown_document):
         return [elem for elem in markdown_document.main.children]
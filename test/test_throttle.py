@@ -0,0 +1,134 @@
+"""Test the LLM limiter"""
+
+import pytest
+from agno.exceptions import ModelProviderError
+from loguru import logger
+
+from slidegen.workflows import _throttle
+from slidegen.workflows._throttle import AsyncLLMLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TestAsyncLLMLimiter:
+    """Test AsyncLLMLimiter"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the limiter's clock and sleep with a fake clock"""
+        clock = FakeClock()
+        monkeypatch.setattr(_throttle.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(_throttle.asyncio, "sleep", clock.sleep)
+        return clock
+
+    @staticmethod
+    async def _ok() -> str:
+        return "ok"
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute(self, clock):
+        """Test calls over the request budget wait until the oldest call leaves the window"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=2, jitter=0)
+
+        for _ in range(3):
+            assert await limiter.run(self._ok) == "ok"
+
+        assert clock.sleeps == [60.0]
+        logger.info("Successfully delayed the call over the request budget")
+
+    @pytest.mark.asyncio
+    async def test_window_slides(self, clock):
+        """Test calls are not delayed once the earlier calls are older than the window"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=2, jitter=0)
+
+        await limiter.run(self._ok)
+        clock.now += 30
+        await limiter.run(self._ok)
+        clock.now += 31
+        # The first call left the window, the second is still in it
+        await limiter.run(self._ok)
+
+        assert clock.sleeps == []
+        await limiter.run(self._ok)
+        assert clock.sleeps == [29.0]
+        logger.info("Successfully slid the request window")
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute(self, clock):
+        """Test calls over the token budget wait until enough tokens leave the window"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=100, tpm=100, jitter=0)
+
+        await limiter.run(self._ok, est_tokens=60)
+        await limiter.run(self._ok, est_tokens=30)
+        assert clock.sleeps == []
+
+        await limiter.run(self._ok, est_tokens=60)
+        assert clock.sleeps == [60.0]
+        logger.info("Successfully delayed the call over the token budget")
+
+    @pytest.mark.asyncio
+    async def test_retry_rate_limit(self, clock):
+        """Test 429 errors are retried with exponential backoff"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=100, base_delay=1.0, jitter=0)
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            if calls <= 2:
+                raise ModelProviderError("rate limited", status_code=429)
+            return "ok"
+
+        assert await limiter.run(call) == "ok"
+        assert calls == 3
+        assert clock.sleeps == [1.0, 2.0]
+        logger.info("Successfully retried rate limited calls")
+
+    @pytest.mark.asyncio
+    async def test_retry_gives_up(self, clock):
+        """Test a persistent 429 is raised after the last retry"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=100, max_retries=2, base_delay=1.0, jitter=0)
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            raise ModelProviderError("rate limited", status_code=429)
+
+        with pytest.raises(ModelProviderError):
+            await limiter.run(call)
+
+        assert calls == 3
+        assert clock.sleeps == [1.0, 2.0]
+        logger.info("Successfully gave up after the last retry")
+
+    @pytest.mark.asyncio
+    async def test_no_retry_other_errors(self, clock):
+        """Test provider errors other than 429 are raised without retrying"""
+        limiter = AsyncLLMLimiter(max_concurrency=4, rpm=100, jitter=0)
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            raise ModelProviderError("server error", status_code=500)
+
+        with pytest.raises(ModelProviderError):
+            await limiter.run(call)
+
+        assert calls == 1
+        assert clock.sleeps == []
+        logger.info("Successfully raised a non rate limit error")